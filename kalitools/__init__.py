@@ -5,10 +5,12 @@ from __future__ import annotations
 import logging
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from rich.console import Console
 
-from .theme import get_theme, strip_emojis
+    from .manager import KaliToolsManager
 
 __all__ = [
     "console",
@@ -16,6 +18,7 @@ __all__ = [
     "configure_logging",
     "configure_console",
     "NO_EMOJI",
+    "KaliToolsManager",
 ]
 
 __version__ = "0.3.0"
@@ -24,30 +27,31 @@ __version__ = "0.3.0"
 # that import the package before the CLI parses flags.
 NO_EMOJI: bool = bool(os.environ.get("KALITOOLS_NO_EMOJI"))
 
+logger = logging.getLogger("kalitools")
 
-class _EmojiAwareConsole(Console):
-    """Rich ``Console`` subclass that strips emoji glyphs when requested."""
+_LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 
-    def __init__(self, *args, no_emoji: bool = False, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self._no_emoji = no_emoji
 
-    def print(self, *objects, **kwargs):  # type: ignore[override]
-        if self._no_emoji and objects:
-            objects = tuple(
-                strip_emojis(o) if isinstance(o, str) else o for o in objects
-            )
-        return super().print(*objects, **kwargs)
+class _LazyStreamHandler(logging.Handler):
+    """Console handler that builds its ``StreamHandler`` on the first record.
 
+    Most CLI runs never emit a log record, so the formatter and stream setup
+    is only paid for when something is actually logged.
+    """
 
-# The console singleton is re-bound by `configure_console` when the CLI parses
-# `--theme` / `--no-emoji`. All modules still get a live reference because they
-# `from . import console` (module attribute lookup is done at print time).
-console: Console = _EmojiAwareConsole(
-    theme=get_theme(os.environ.get("KALITOOLS_THEME", "default")),
-    no_emoji=NO_EMOJI,
-)
-logger = logging.getLogger("kalitools")
+    def __init__(self) -> None:
+        super().__init__()
+        self._stream: logging.StreamHandler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._stream is None:
+            self._stream = logging.StreamHandler()
+            self._stream.setFormatter(logging.Formatter(_LOG_FORMAT))
+        self._stream.emit(record)
+
+    def flush(self) -> None:
+        if self._stream is not None:
+            self._stream.flush()
 
 
 def configure_logging(level: str = "INFO", *, log_file: str | None = None) -> None:
@@ -62,16 +66,13 @@ def configure_logging(level: str = "INFO", *, log_file: str | None = None) -> No
     root_logger = logging.getLogger()
     root_logger.setLevel(lvl)
 
-    fmt = logging.Formatter("%(asctime)s | %(levelname)-8s | %(name)s | %(message)s")
-
     has_stream = any(
-        isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)
+        isinstance(h, _LazyStreamHandler)
+        or (isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler))
         for h in root_logger.handlers
     )
     if not has_stream:
-        stream = logging.StreamHandler()
-        stream.setFormatter(fmt)
-        root_logger.addHandler(stream)
+        root_logger.addHandler(_LazyStreamHandler())
 
     if log_file:
         path = Path(log_file).expanduser()
@@ -82,8 +83,9 @@ def configure_logging(level: str = "INFO", *, log_file: str | None = None) -> No
             for h in root_logger.handlers
         )
         if not already:
-            fh = logging.FileHandler(path, encoding="utf-8")
-            fh.setFormatter(fmt)
+            # delay=True: the file is only opened when the first record lands.
+            fh = logging.FileHandler(path, encoding="utf-8", delay=True)
+            fh.setFormatter(logging.Formatter(_LOG_FORMAT))
             root_logger.addHandler(fh)
 
 
@@ -93,19 +95,50 @@ def configure_console(*, theme: str = "default", no_emoji: bool = False) -> Cons
     Mutates the existing singleton so modules that did ``from . import
     console`` before CLI parsing still observe the new theme / emoji policy.
     """
+    from .theme import get_theme
+
     global NO_EMOJI
     NO_EMOJI = bool(no_emoji or os.environ.get("KALITOOLS_NO_EMOJI"))
-    console._no_emoji = NO_EMOJI  # type: ignore[attr-defined]
+    shared = _get_console()
+    shared._no_emoji = NO_EMOJI  # type: ignore[attr-defined]
     try:
-        console.push_theme(get_theme(theme))
+        shared.push_theme(get_theme(theme))
     except Exception:  # pragma: no cover
         pass
-    return console
+    return shared
+
+
+def _get_console() -> Console:
+    try:
+        return globals()["console"]
+    except KeyError:
+        return __getattr__("console")
 
 
-try:  # Re-export for callers/tests that expect package-level access
-    from .manager import KaliToolsManager  # noqa: E402
+def __getattr__(name: str) -> Any:
+    """Build ``console`` / ``KaliToolsManager`` on first access (PEP 562).
 
-    __all__.append("KaliToolsManager")
-except Exception:  # pragma: no cover - avoid failing during partial installs
-    KaliToolsManager = None  # type: ignore
+    Importing Rich and the manager stack costs hundreds of milliseconds, so
+    ``kalitools --help`` and library users that only need ``logger`` never
+    pay for it. The value is cached in the module namespace, after which
+    normal attribute lookup takes over.
+    """
+    if name == "console":
+        from .theme import EmojiAwareConsole, get_theme
+
+        # The console singleton is re-bound by `configure_console` when the CLI
+        # parses `--theme` / `--no-emoji`. All modules still get a live
+        # reference because they `from . import console` after it is built.
+        value: Any = EmojiAwareConsole(
+            theme=get_theme(os.environ.get("KALITOOLS_THEME", "default")),
+            no_emoji=NO_EMOJI,
+        )
+    elif name == "KaliToolsManager":
+        try:  # Re-export for callers/tests that expect package-level access
+            from .manager import KaliToolsManager as value
+        except Exception:  # pragma: no cover - avoid failing during partial installs
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
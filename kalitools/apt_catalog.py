@@ -29,7 +29,7 @@ from typing import Any
 
 from . import logger
 from .constants import (
-    CATEGORY_KEYWORD_HINTS,
+    CATEGORY_KEYWORDS_LC,
     META_CATEGORY_SOURCES,
     get_subcategory_for,
 )
@@ -75,7 +75,7 @@ def _debtag_to_category(tags: Sequence[str]) -> str | None:
 def _keyword_category(name: str, description: str) -> str | None:
     haystack = f"{name} {description}".lower()
     best: tuple[str, int] | None = None
-    for cat, keywords in CATEGORY_KEYWORD_HINTS.items():
+    for cat, keywords in CATEGORY_KEYWORDS_LC.items():
         hits = sum(1 for k in keywords if k in haystack)
         if hits and (best is None or hits > best[1]):
             best = (cat, hits)
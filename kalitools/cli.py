@@ -18,14 +18,24 @@ Design goals:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import sys
 from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from . import __version__, configure_logging, console
+from . import __version__
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from rich.console import Console
+
+    from .model import Tool
+
+# Bound in `main()` / `tui_main()` once arguments are parsed so that `--help`
+# and `--version` never import Rich.
+console: Console
 
 try:
     import termios  # noqa: F401 parity with UI module
@@ -35,13 +45,37 @@ try:
 except ImportError:
     TERMIOS_AVAILABLE = False
 
+_IS_LINUX = sys.platform.startswith("linux")
+
 
 # ---------------------------------------------------------------------------
 # Parser
 # ---------------------------------------------------------------------------
 
+class _ArgumentParser(argparse.ArgumentParser):
+    """``ArgumentParser`` that reuses one formatter while arguments are added.
+
+    ``add_argument`` builds a throwaway ``HelpFormatter`` (twice on CPython
+    3.14+, each probing the terminal for colour support) just to validate the
+    metavar and help string. Help rendering still gets a fresh formatter.
+    """
+
+    _validation_formatter: argparse.HelpFormatter | None = None
+
+    def add_argument(self, *args, **kwargs):
+        if self._validation_formatter is None:
+            self._validation_formatter = self._get_formatter()
+        formatter = self._validation_formatter
+        self._get_formatter = lambda: formatter  # type: ignore[method-assign]
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            del self._get_formatter
+
+
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
+    parser = _ArgumentParser(
         prog="kalitools",
         description="Discover and manage Kali Linux tooling from the terminal.",
     )
@@ -65,8 +99,9 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--discovery-workers",
         type=int,
-        default=8,
-        help="Concurrent scraper workers for legacy web discovery.",
+        default=None,
+        help="Concurrent scraper workers for legacy web discovery "
+        "(default: $KALITOOLS_MAX_WORKERS, else 4 per CPU up to 16).",
     )
     parser.add_argument(
         "--discovery-delay",
@@ -199,6 +234,7 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.lru_cache(maxsize=4)
 def resolve_ui_mode(requested: str) -> str:
     if requested == "auto":
         return "rich" if TERMIOS_AVAILABLE else "basic"
@@ -248,19 +284,19 @@ def _prompt_confirm(question: str, *, assume_yes: bool, default: bool = False) -
 
 def cmd_list(args: argparse.Namespace) -> int:
     manager = _make_manager(args)
-    tools = manager.tools
+    if args.category:
+        tools = manager.filter_by_category(args.category.strip().lower())
+    else:
+        tools = manager.tools
     if args.installed:
-        tools = [t for t in tools if t.get("installed")]
+        tools = [t for t in tools if t.installed]
     if args.available:
-        tools = [t for t in tools if not t.get("installed")]
-    if args.category:
-        cat = args.category.strip().lower()
-        tools = [t for t in tools if (t.get("category") or "other") == cat]
+        tools = [t for t in tools if not t.installed]
     if args.starred:
         from .state import get_state_db
 
         starred = set(get_state_db().star_list())
-        tools = [t for t in tools if t.get("name") in starred]
+        tools = [t for t in tools if t.name in starred]
     if args.limit and args.limit > 0:
         tools = tools[: args.limit]
 
@@ -272,10 +308,10 @@ def cmd_list(args: argparse.Namespace) -> int:
 
     starred = set(get_state_db().star_list())
     rows = [{
-        "name": ("* " if t.get("name") in starred else "  ") + str(t.get("name")),
-        "category": t.get("category") or "other",
-        "installed": "yes" if t.get("installed") else "no",
-        "size": t.get("size") or 0,
+        "name": ("* " if t.name in starred else "  ") + t.name,
+        "category": t.category,
+        "installed": "yes" if t.installed else "no",
+        "size": t.size,
     } for t in tools]
     _print_table(rows, ["name", "category", "installed", "size"])
     console.print(f"[dim]{len(rows)} tool(s)[/dim]")
@@ -300,12 +336,12 @@ def _parse_search_query(tokens: list[str]) -> tuple[str, dict[str, str]]:
     return " ".join(free).strip().lower(), filters
 
 
-def _score_tool(tool: dict, query: str) -> int:
+def _score_tool(tool: Tool, query: str) -> int:
     """Return 0..100 match score. Uses rapidfuzz if available, else substring heuristic."""
     if not query:
         return 50
-    name = (tool.get("name") or "").lower()
-    desc = (tool.get("description") or "").lower()
+    name = tool.name_lower
+    desc = tool.description.lower()
     try:
         from rapidfuzz import fuzz
 
@@ -329,9 +365,9 @@ def cmd_search(args: argparse.Namespace) -> int:
     manager = _make_manager(args)
     query, filters = _parse_search_query(args.query)
 
-    def _match_filters(t: dict) -> bool:
+    def _match_filters(t: Tool) -> bool:
         if "category" in filters:
-            if (t.get("category") or "other").lower() != filters["category"]:
+            if t.category != filters["category"]:
                 return False
         if "tag" in filters:
             tags = [str(x).lower() for x in (t.get("tags") or [])]
@@ -339,7 +375,7 @@ def cmd_search(args: argparse.Namespace) -> int:
                 return False
         if "installed" in filters:
             want = filters["installed"] in {"yes", "true", "1"}
-            if bool(t.get("installed")) != want:
+            if t.installed != want:
                 return False
         return True
 
@@ -347,14 +383,14 @@ def cmd_search(args: argparse.Namespace) -> int:
     scored = [(t, _score_tool(t, query)) for t in candidates]
     threshold = 50 if query else 0
     scored = [(t, s) for t, s in scored if s >= threshold]
-    scored.sort(key=lambda p: (-p[1], p[0].get("name") or ""))
+    scored.sort(key=lambda p: (-p[1], p[0].name))
     hits = [t for t, _ in scored[: max(args.limit, 1)]]
 
     if args.as_json:
         print(json.dumps([_tool_to_dict(t) for t in hits], indent=2))
         return 0
-    rows = [{"name": t.get("name"), "category": t.get("category") or "other",
-             "description": (t.get("description") or "")[:70]} for t in hits]
+    rows = [{"name": t.name, "category": t.category,
+             "description": t.description[:70]} for t in hits]
     _print_table(rows, ["name", "category", "description"])
     console.print(f"[dim]{len(rows)} match(es) for {' '.join(args.query)!r}[/dim]")
     return 0
@@ -447,6 +483,9 @@ def _bulk_action(
     dry_run: bool,
 ) -> int:
     failures = 0
+    packages = list(packages)
+    if action == "install" and not dry_run:
+        manager.prewarm_dependencies(packages)
     for pkg in packages:
         console.print(f"\n[cyan]{action}[/cyan] {pkg}")
         if dry_run:
@@ -515,8 +554,10 @@ def cmd_catalog(args: argparse.Namespace) -> int:
         if not data_path.exists():
             console.print("[red]Catalog file missing.[/red]")
             return 1
+        from .manager import _json_loads
+
         try:
-            payload = json.loads(data_path.read_text(encoding="utf-8"))
+            payload = _json_loads(data_path.read_bytes())
         except Exception as exc:
             console.print(f"[red]Cannot parse catalog: {exc}[/red]")
             return 1
@@ -626,7 +667,7 @@ def cmd_profile(args: argparse.Namespace) -> int:
         return 1
     console.print(f"[cyan]Applying profile {prof.slug} ({len(prof.packages)} pkg)...[/cyan]")
     manager = _make_manager(args)
-    known = {t.get("name") for t in manager.tools}
+    known = {t.name for t in manager.tools}
     filtered = [p for p in prof.packages if p in known] or list(prof.packages)
     if not _prompt_confirm(
         f"Install {len(filtered)} package(s) from profile {prof.slug}?",
@@ -667,7 +708,7 @@ def cmd_history(args: argparse.Namespace) -> int:
 
 def cmd_export(args: argparse.Namespace) -> int:
     manager = _make_manager(args)
-    installed = [t for t in manager.tools if t.get("installed")]
+    installed = manager.filter_by_status(True)
     if args.format == "json":
         from datetime import datetime, timezone
 
@@ -688,7 +729,7 @@ def cmd_export(args: argparse.Namespace) -> int:
             "PKGS=(",
         ]
         for t in installed:
-            lines.append(f"  {t.get('name')}")
+            lines.append(f"  {t.name}")
         lines += [
             ")",
             'for pkg in "${PKGS[@]}"; do',
@@ -759,27 +800,38 @@ def _run_interactive(args: argparse.Namespace) -> None:
 
 
 def main(argv: Iterable[str] | None = None) -> None:
+    global console
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # `kalitools --version` is common in scripts and bug reports; answer it
+    # without constructing the full parser and its subcommand tree.
+    if argv == ["--version"]:
+        print(f"kalitools {__version__}")
+        raise SystemExit(0)
+
     parser = build_parser()
     args = parser.parse_args(argv)
+
+    # Bail out before Rich (or anything else heavy) is imported.
+    if not _IS_LINUX:
+        print(
+            "Kali Tools Manager requires Kali Linux or another Debian-based Linux distribution.",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+
+    from . import configure_console, configure_logging
+
     configure_logging(args.log_level, log_file=getattr(args, "log_file", None))
 
     # Rebuild the shared console with the chosen theme / emoji policy before
     # any other module uses it.
-    from . import configure_console
-
-    configure_console(theme=getattr(args, "theme", "default"),
-                      no_emoji=bool(getattr(args, "no_emoji", False)))
+    console = configure_console(theme=getattr(args, "theme", "default"),
+                                no_emoji=bool(getattr(args, "no_emoji", False)))
     if args.no_emoji:
         os.environ["KALITOOLS_NO_EMOJI"] = "1"
     if getattr(args, "offline", False):
         os.environ["KALITOOLS_OFFLINE"] = "1"
 
-    if not sys.platform.startswith("linux"):
-        console.print(
-            "[red]Kali Tools Manager requires Kali Linux or another Debian-based Linux distribution.[/red]"
-        )
-        raise SystemExit(1)
-
     try:
         if args.command is None:
             _run_interactive(args)
@@ -808,12 +860,14 @@ def main(argv: Iterable[str] | None = None) -> None:
 
 def tui_main(argv: Iterable[str] | None = None) -> None:
     """Entry point for the ``kalitools-tui`` console script."""
+    global console
     args = build_parser().parse_args(list(argv) if argv else [])
     args.tui = True
     args.command = None
-    configure_logging(args.log_level, log_file=getattr(args, "log_file", None))
-    from . import configure_console
 
-    configure_console(theme=getattr(args, "theme", "default"),
-                      no_emoji=bool(getattr(args, "no_emoji", False)))
+    from . import configure_console, configure_logging
+
+    configure_logging(args.log_level, log_file=getattr(args, "log_file", None))
+    console = configure_console(theme=getattr(args, "theme", "default"),
+                                no_emoji=bool(getattr(args, "no_emoji", False)))
     _run_interactive(args)
@@ -3,13 +3,71 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
-from datetime import datetime, timezone
-from pathlib import Path
+import os
+from collections.abc import Callable, Iterable
+from typing import Any
 
 from . import console
 from .model import Tool
 
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson  # type: ignore
+
+    IJSON_AVAILABLE = True
+    _STREAM_ERRORS: tuple[type[Exception], ...] = (ijson.JSONError,)
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore
+    IJSON_AVAILABLE = False
+    _STREAM_ERRORS = ()
+
+# Imports larger than this are streamed with ijson (when installed) so only
+# one tool entry at a time is materialised instead of the whole document.
+STREAM_THRESHOLD_BYTES = 1 << 20
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialise *payload* as indented UTF-8 JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _loads(payload: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson when installed).
+
+    ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError`` so callers
+    only need to catch the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _write_bytes(filename: str, payload: bytes) -> None:
+    """Write *payload* to *filename* with raw ``os`` calls (no file object)."""
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _read_fd(fd: int) -> bytes:
+    chunks: list[bytes] = []
+    while chunk := os.read(fd, 65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
 
 class ConfigManager:
     """Import / export helper for :class:`Tool` lists."""
@@ -19,18 +77,22 @@ class ConfigManager:
 
     # ----- export -------------------------------------------------------------
     def export_tools_list(self, filename: str) -> bool:
+        from datetime import datetime, timezone
+
         try:
-            installed = [t for t in self.tools if t.installed]
+            exported: list[dict[str, Any]] = []
+            for t in self.tools:
+                if t.installed:
+                    exported.append(
+                        {"name": t.name, "commands": list(t.commands), "category": t.category}
+                    )
             export_data = {
                 "exported_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-                "total_tools": len(installed),
-                "tools": [
-                    {"name": t.name, "commands": list(t.commands), "category": t.category}
-                    for t in installed
-                ],
+                "total_tools": len(exported),
+                "tools": exported,
             }
-            Path(filename).write_text(json.dumps(export_data, indent=2), encoding="utf-8")
-            console.print(f"[green]✓ Exported {len(installed)} tools to {filename}[/green]")
+            _write_bytes(filename, _dumps(export_data))
+            console.print(f"[green]✓ Exported {len(exported)} tools to {filename}[/green]")
             return True
         except OSError as exc:
             console.print(f"[red]Error exporting tools: {exc}[/red]")
@@ -39,16 +101,32 @@ class ConfigManager:
     # ----- import -------------------------------------------------------------
     def _read_tool_names(self, filename: str) -> list[str]:
         try:
-            payload = Path(filename).read_text(encoding="utf-8")
+            fd = os.open(filename, os.O_RDONLY)
+            try:
+                if ijson is not None and os.fstat(fd).st_size > STREAM_THRESHOLD_BYTES:
+                    # The file object owns (and closes) the descriptor from here.
+                    handle, fd = os.fdopen(fd, "rb"), -1
+                    with handle:
+                        return self._collect_names(ijson.items(handle, "tools.item"))
+                payload = _read_fd(fd)
+            finally:
+                if fd >= 0:
+                    os.close(fd)
         except OSError as exc:
             console.print(f"[red]Could not read {filename}: {exc}[/red]")
             return []
+        except _STREAM_ERRORS as exc:
+            console.print(f"[red]Invalid JSON in {filename}: {exc}[/red]")
+            return []
         try:
-            data = json.loads(payload)
+            data = _loads(payload)
         except json.JSONDecodeError as exc:
             console.print(f"[red]Invalid JSON in {filename}: {exc}[/red]")
             return []
-        tools = data.get("tools") or []
+        return self._collect_names(data.get("tools") or [])
+
+    @staticmethod
+    def _collect_names(tools: Iterable[Any]) -> list[str]:
         names: list[str] = []
         seen: set[str] = set()
         for entry in tools:
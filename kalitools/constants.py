@@ -2,6 +2,31 @@
 
 from __future__ import annotations
 
+import re
+import sys
+import types
+from functools import lru_cache
+
+__all__ = [
+    'CATEGORY_ICONS',
+    'CATEGORY_NAMES',
+    'CATEGORIES',
+    'TOOL_TO_CATEGORY',
+    'CATEGORY_DESCRIPTIONS',
+    'CATEGORY_DEFAULT_SUBCATEGORY',
+    'SUBCATEGORY_MAP',
+    'TOOL_DESCRIPTIONS',
+    'CATEGORY_KEYWORD_HINTS',
+    'CATEGORY_KEYWORDS_LC',
+    'CATEGORY_KEYWORD_PATTERNS',
+    'SUBCATEGORY_KEYWORD_HINTS',
+    'SUBCATEGORY_KEYWORD_PATTERNS',
+    'META_CATEGORY_SOURCES',
+    'get_category_description',
+    'get_subcategory_for',
+    'get_category_display_name',
+]
+
 CATEGORY_ICONS = {
     'web': '🌐',
     'wireless': '📡',
@@ -274,19 +299,95 @@ META_CATEGORY_SOURCES = {
 }
 
 
+# --- Derived lookup tables (built once at import time) ---------------------
+
+# Freeze the per-category tool lists into tuples and intern every name and
+# label, so repeated literals ('General', 'Discovery', 'sqlmap', ...) shared
+# between CATEGORIES and SUBCATEGORY_MAP point at a single string object.
+CATEGORIES: dict[str, tuple[str, ...]] = {
+    sys.intern(category): tuple(sys.intern(name) for name in names)
+    for category, names in CATEGORIES.items()
+}
+SUBCATEGORY_MAP = {
+    sys.intern(category): {sys.intern(name): sys.intern(sub) for name, sub in names.items()}
+    for category, names in SUBCATEGORY_MAP.items()
+}
+CATEGORY_DEFAULT_SUBCATEGORY = {
+    sys.intern(category): sys.intern(sub)
+    for category, sub in CATEGORY_DEFAULT_SUBCATEGORY.items()
+}
+
+# Read-only views: these tables are shared by every module and never mutated
+# after import, so expose them behind a mappingproxy with interned keys.
+CATEGORY_ICONS = types.MappingProxyType(
+    {sys.intern(slug): icon for slug, icon in CATEGORY_ICONS.items()}
+)
+CATEGORY_NAMES = types.MappingProxyType(
+    {sys.intern(slug): sys.intern(label) for slug, label in CATEGORY_NAMES.items()}
+)
+
+# Reverse index tool -> category. Later categories win for tools listed twice
+# (e.g. ``whatweb`` in both web and recon), matching the historical lookup.
+TOOL_TO_CATEGORY: dict[str, str] = {
+    name.lower(): category
+    for category, names in CATEGORIES.items()
+    for name in names
+}
+
+CATEGORY_KEYWORDS_LC: dict[str, tuple[str, ...]] = {
+    category: tuple(word.lower() for word in words)
+    for category, words in CATEGORY_KEYWORD_HINTS.items()
+}
+
+
+def _keyword_pattern(words: list[str]) -> re.Pattern[str]:
+    return re.compile('|'.join(re.escape(word.lower()) for word in words))
+
+
+# One alternation per category (and per subcategory), searched in declaration
+# order so the first category with any keyword hit still wins. Haystacks are
+# lower-cased by the caller, so no IGNORECASE is needed.
+CATEGORY_KEYWORD_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (category, _keyword_pattern(words))
+    for category, words in CATEGORY_KEYWORD_HINTS.items()
+)
+SUBCATEGORY_KEYWORD_PATTERNS: dict[str, tuple[tuple[str, re.Pattern[str]], ...]] = {
+    category: tuple((sub, _keyword_pattern(words)) for sub, words in mapping.items())
+    for category, mapping in SUBCATEGORY_KEYWORD_HINTS.items()
+}
+
+# Flattened ``(category, tool) -> subcategory`` view of SUBCATEGORY_MAP so a
+# lookup is a single dict probe instead of two chained ``.get`` calls.
+_SUBCATEGORY_FLAT: dict[tuple[str, str], str] = {
+    (category, name): subcategory
+    for category, names in SUBCATEGORY_MAP.items()
+    for name, subcategory in names.items()
+}
+
+# Display label for every known slug, so the common case is one dict probe.
+_CATEGORY_DISPLAY: dict[str, str] = {
+    slug: CATEGORY_NAMES.get(slug, slug.title())
+    for slug in set(CATEGORIES) | set(CATEGORY_NAMES)
+}
+
+
+@lru_cache(maxsize=4096)
 def get_category_description(cat: str | None) -> str | None:
     if not cat:
         return None
     return CATEGORY_DESCRIPTIONS.get(cat)
 
 
+@lru_cache(maxsize=4096)
 def get_subcategory_for(name: str, category: str | None) -> str:
     cat = (category or 'other').lower()
-    mapping = SUBCATEGORY_MAP.get(cat, {})
-    return mapping.get(name, '')
+    return _SUBCATEGORY_FLAT.get((cat, name), '')
 
 
 def get_category_display_name(category: str | None) -> str:
     if not category:
         return 'Other'
-    return CATEGORY_NAMES.get(category.lower(), category.title())
+    label = _CATEGORY_DISPLAY.get(category)
+    if label is None:
+        label = CATEGORY_NAMES.get(category.lower(), category.title())
+    return label
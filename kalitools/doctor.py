@@ -5,7 +5,6 @@ Each check returns a :class:`CheckResult` with a severity (``ok``, ``warn``,
 """
 from __future__ import annotations
 
-import json
 import os
 import shutil
 import socket
@@ -164,7 +163,9 @@ def _check_catalog() -> CheckResult:
                 "Catalog file missing",
                 "Run `kalitools catalog refresh`.",
             )
-        payload = json.loads(data_path.read_text(encoding="utf-8"))
+        from .manager import _json_loads
+
+        payload = _json_loads(data_path.read_bytes())
         tools = payload.get("tools", payload if isinstance(payload, list) else [])
         generated = payload.get("generated_at") if isinstance(payload, dict) else None
         return CheckResult(
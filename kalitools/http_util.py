@@ -8,25 +8,29 @@ Implements:
 * Per-request timeout and a global circuit breaker per host.
 * Honours ``KALITOOLS_OFFLINE=1`` — returns ``None`` without making a
   request so the rest of the CLI keeps working on air-gapped hosts.
+* One shared keep-alive ``requests.Session`` so repeated fetches from the
+  same host reuse TCP/TLS connections.
+* An on-disk page cache (``cached_get``) so re-discovery only re-fetches
+  pages older than a TTL, revalidating them with ``ETag`` /
+  ``Last-Modified`` so unchanged pages come back as a bodiless 304.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import random
+import tempfile
 import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from threading import Lock
 from typing import Any
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
-try:
-    import requests
-except ImportError:  # pragma: no cover
-    requests = None  # type: ignore
-
 from . import __version__
 
 logger = logging.getLogger("kalitools.http")
@@ -42,6 +46,8 @@ INITIAL_BACKOFF = 1.5
 MAX_BACKOFF = 15.0
 CIRCUIT_FAIL_THRESHOLD = 5  # per-host consecutive failures
 CIRCUIT_COOLDOWN = 120.0  # seconds to back off the host
+PAGE_CACHE_TTL = 7 * 86400.0  # seconds a cached page body stays fresh
+POOL_MAXSIZE = 16  # keep-alive connections kept open per host; also caps default_workers()
 
 
 @dataclass
@@ -55,6 +61,65 @@ class _HostState:
 
 _HOSTS: dict[str, _HostState] = {}
 _HOSTS_LOCK = Lock()
+_SESSION: Any | None = None
+_SESSION_LOCK = Lock()
+
+
+def _requests() -> Any | None:
+    """Import ``requests`` on first use so importing this module stays cheap."""
+    try:
+        import requests
+    except ImportError:  # pragma: no cover
+        return None
+    return requests
+
+
+def default_workers() -> int:
+    """Default number of concurrent fetch workers.
+
+    ``KALITOOLS_MAX_WORKERS`` wins when set to a positive integer; otherwise
+    four per usable CPU, capped at :data:`POOL_MAXSIZE` so worker threads
+    never outnumber pooled connections (or hammer one host).
+    """
+    raw = os.environ.get("KALITOOLS_MAX_WORKERS")
+    if raw:
+        try:
+            value = int(raw)
+        except ValueError:
+            value = 0
+        if value > 0:
+            return value
+        logger.warning("ignoring invalid KALITOOLS_MAX_WORKERS=%r", raw)
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - non-Linux
+        cpus = os.cpu_count() or 1
+    return min(POOL_MAXSIZE, 4 * cpus)
+
+
+def _session() -> Any | None:
+    """Return the shared keep-alive session, or ``None`` without ``requests``.
+
+    Retries stay in :func:`polite_get`, so the adapter only pools
+    connections and does not retry on its own.
+    """
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    requests = _requests()
+    if requests is None:
+        return None
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(POOL_MAXSIZE, default_workers()))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+    return _SESSION
 
 
 def offline() -> bool:
@@ -72,12 +137,13 @@ def _host_state(host: str) -> _HostState:
 
 
 def _fetch_robots(host_url: str, state: _HostState) -> None:
-    if state.robots_fetched or requests is None:
+    session = _session()
+    if state.robots_fetched or session is None:
         return
     parser = RobotFileParser()
     try:
         url = f"{host_url}/robots.txt"
-        resp = requests.get(url, timeout=5, headers={"User-Agent": USER_AGENT})
+        resp = session.get(url, timeout=5)
         if resp.status_code == 200:
             parser.parse(resp.text.splitlines())
         else:
@@ -118,7 +184,9 @@ def polite_get(
     Returns a ``requests.Response`` on success, or ``None`` on offline mode,
     circuit-open, robots-disallow, or persistent failure.
     """
-    if requests is None:
+    requests = _requests()
+    session = _session()
+    if session is None:
         return None
     if offline():
         logger.debug("offline mode; skipping GET %s", url)
@@ -148,7 +216,7 @@ def polite_get(
     last_exc: Exception | None = None
     for attempt in range(1, max_attempts + 1):
         try:
-            resp = requests.get(url, timeout=timeout, headers=merged_headers)
+            resp = session.get(url, timeout=timeout, headers=merged_headers)
             if resp.status_code < 500 and resp.status_code != 429:
                 with state.lock:
                     state.fails = 0
@@ -173,3 +241,103 @@ def polite_get(
     if last_exc is not None:
         logger.info("giving up on %s after %d attempts: %s", url, max_attempts, last_exc)
     return None
+
+
+def page_cache_dir() -> Path:
+    return Path.home() / ".cache" / "kalitools" / "pages"
+
+
+def _page_cache_path(url: str) -> Path:
+    digest = hashlib.sha1(url.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return page_cache_dir() / f"{digest}.body"
+
+
+def _store_page(path: Path, body: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(body)
+        os.replace(tmp_name, path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _load_validators(path: Path) -> dict[str, str]:
+    """Return conditional-request headers saved next to a cached page."""
+    try:
+        saved = json.loads(path.with_suffix(".meta").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    headers: dict[str, str] = {}
+    if saved.get("etag"):
+        headers["If-None-Match"] = saved["etag"]
+    if saved.get("last_modified"):
+        headers["If-Modified-Since"] = saved["last_modified"]
+    return headers
+
+
+def _store_validators(path: Path, resp: Any) -> None:
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    meta = path.with_suffix(".meta")
+    if not (etag or last_modified):
+        try:
+            meta.unlink()
+        except OSError:
+            pass
+        return
+    _store_page(meta, json.dumps({"etag": etag, "last_modified": last_modified}).encode("utf-8"))
+
+
+def cached_get(
+    url: str,
+    *,
+    ttl: float = PAGE_CACHE_TTL,
+    timeout: float = DEFAULT_TIMEOUT,
+    delay: float = 0.0,
+) -> bytes | None:
+    """Return the body of *url*, served from the page cache when fresh.
+
+    Cache entries live under :func:`page_cache_dir` keyed by the SHA-1 of the
+    URL and are considered fresh for *ttl* seconds (``ttl <= 0`` forces a
+    re-fetch). Stale entries are revalidated with the saved ``ETag`` /
+    ``Last-Modified``; a ``304`` returns the cached body and restarts its
+    TTL. *delay* is slept only before a real network request, so cache
+    hits skip the politeness pause. Only ``200`` responses are cached; any
+    other outcome returns ``None`` just like :func:`polite_get`.
+    """
+    path = _page_cache_path(url)
+    headers: dict[str, str] = {}
+    if ttl > 0:
+        try:
+            if path.stat().st_mtime > time.time() - ttl:
+                return path.read_bytes()
+            headers = _load_validators(path)
+        except OSError:
+            pass
+
+    if delay:
+        time.sleep(delay)
+    resp = polite_get(url, timeout=timeout, headers=headers or None)
+    if resp is not None and resp.status_code == 304 and headers:
+        try:
+            body = path.read_bytes()
+            os.utime(path)  # fresh again for another ttl
+            return body
+        except OSError:
+            # Body vanished since the stat; fetch it unconditionally.
+            resp = polite_get(url, timeout=timeout)
+    if resp is None or resp.status_code != 200:
+        return None
+    body = resp.content
+    try:
+        _store_page(path, body)
+        _store_validators(path, resp)
+    except OSError as exc:
+        logger.debug("could not cache %s: %s", url, exc)
+    return body
@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import atexit
+import codecs
+import hashlib
 import json
 import os
 import re
 import shlex
 import shutil
 import subprocess
+import sys
 import tempfile
+import threading
 import time
 from collections import deque
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
+from functools import cache, lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from threading import Lock
 from typing import Any
 
 from rich.panel import Panel
@@ -33,44 +46,82 @@ from rich.text import Text
 from . import console, logger
 from .config import ConfigManager
 from .constants import (
-    CATEGORIES,
     CATEGORY_DEFAULT_SUBCATEGORY,
     CATEGORY_ICONS,
-    CATEGORY_KEYWORD_HINTS,
+    CATEGORY_KEYWORD_PATTERNS,
     CATEGORY_NAMES,
     META_CATEGORY_SOURCES,
-    SUBCATEGORY_KEYWORD_HINTS,
+    SUBCATEGORY_KEYWORD_PATTERNS,
     TOOL_DESCRIPTIONS,
+    TOOL_TO_CATEGORY,
     get_category_display_name,
     get_subcategory_for,
 )
+from .http_util import PAGE_CACHE_TTL, default_workers
 from .http_util import offline as is_offline_mode
-from .model import Tool
+from .model import Tool, ToolTable
 from .notifications import notifications_ready, send_notification
 from .state import get_state_db
 
 try:
-    from kalitools_lib.scraping import parse_tool_page  # type: ignore
-except Exception:
-    parse_tool_page = None  # type: ignore
-
-try:
-    import psutil  # type: ignore
-
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    psutil = None  # type: ignore
-    PSUTIL_AVAILABLE = False
-
-try:
-    import requests  # type: ignore
-    from bs4 import BeautifulSoup  # type: ignore
-
-    WEB_SCRAPING_AVAILABLE = True
-except ImportError:
-    requests = None  # type: ignore
-    BeautifulSoup = None  # type: ignore
-    WEB_SCRAPING_AVAILABLE = False
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+# Parses bytes directly; ``orjson.JSONDecodeError`` subclasses ``ValueError``
+# just like the stdlib error, so existing ``except`` clauses still apply.
+_json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# Written by _fetch_kali_tool_links when the scraper runs in debug mode.
+_DEBUG_SCRAPER_PATH = Path(__file__).resolve().parent / 'debug_scraper.txt'
+
+# Scraping deps are only imported when discovery actually runs; warm starts
+# load the catalog from JSON and never need requests/bs4. find_spec checks
+# availability without executing either package.
+WEB_SCRAPING_AVAILABLE = find_spec("requests") is not None and find_spec("bs4") is not None
+# BeautifulSoup tree builder: lxml's C parser when installed (several times
+# faster on the ~600 kali.org tool pages), else the stdlib html.parser.
+_HTML_PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
+# The all-tools index only needs its <a href> values; selectolax's C parser
+# extracts them without building a BeautifulSoup tree.
+SELECTOLAX_AVAILABLE = find_spec("selectolax") is not None
+
+
+def _iter_hrefs(body: bytes, BeautifulSoup: Any) -> Iterator[str]:
+    """Yield every ``<a href>`` value in *body* (selectolax when installed)."""
+    if SELECTOLAX_AVAILABLE:
+        from selectolax.parser import HTMLParser  # type: ignore
+
+        for node in HTMLParser(body).css('a[href]'):
+            href = node.attributes.get('href')
+            if href:
+                yield href
+        return
+    for a in BeautifulSoup(body, _HTML_PARSER).find_all('a', href=True):
+        yield a['href']
+
+
+@cache
+def _scraping_deps() -> tuple[Any, Callable[..., Any] | None] | None:
+    """Import ``(BeautifulSoup, parse_tool_page)`` on first use.
+
+    Returns ``None`` when the optional scraping extras are missing;
+    ``parse_tool_page`` is ``None`` when ``kalitools_lib`` is unavailable.
+    """
+    if not WEB_SCRAPING_AVAILABLE:
+        return None
+    try:
+        from bs4 import BeautifulSoup  # type: ignore
+    except ImportError:
+        return None
+    try:
+        from kalitools_lib.scraping import parse_tool_page  # type: ignore
+    except Exception:
+        parse_tool_page = None  # type: ignore
+    return BeautifulSoup, parse_tool_page
 
 
 # ---------------------------------------------------------------------------
@@ -194,10 +245,12 @@ LEGACY_FALLBACK_NAMES = [
     "zenmap",
 ]
 
-FALLBACK_NAME_VARIANTS = [
-    {entry['name'].lower() for entry in FALLBACK_TOOL_ENTRIES},
-    {name.lower() for name in LEGACY_FALLBACK_NAMES},
-]
+FALLBACK_NAME_VARIANTS = (
+    frozenset(entry['name'].lower() for entry in FALLBACK_TOOL_ENTRIES),
+    frozenset(name.lower() for name in LEGACY_FALLBACK_NAMES),
+)
+# A list longer than the largest variant can never be a fallback dataset.
+_FALLBACK_MAX_LEN = max(len(variant) for variant in FALLBACK_NAME_VARIANTS)
 
 
 # --- Safety helpers -------------------------------------------------------
@@ -219,13 +272,220 @@ _CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
 _LAUNCH_LEADING_TOKEN_RE = re.compile(r"^[A-Za-z0-9_./\-]+$")
 _LAUNCH_METACHARS = set(";&|`$<>(){}[]*?!\\\"'")
 
+# apt-get progress phrases -> percentage reached once the phrase is seen.
+# Each line is matched with one regex search instead of a chain of
+# substring tests; the tables follow apt's install / remove stage order.
+_APT_INSTALL_STAGES = {
+    'Reading': 15,
+    'Building': 25,
+    'state': 35,
+    'Need to get': 45,
+    'Get:': 45,
+    'Unpacking': 60,
+    'Selecting': 60,
+    'Setting up': 80,
+    'Preparing': 80,
+    'triggers': 90,
+}
+_APT_REMOVE_STAGES = {
+    'Reading': 20,
+    'Building': 35,
+    'state': 50,
+    'Removing': 75,
+    'Purging': 75,
+    'triggers': 90,
+}
+_APT_AUTOREMOVE_STAGES = {
+    'Reading': 20,
+    'Removing': 60,
+    'Processing': 90,
+}
+_APT_INSTALL_STAGE_RE = re.compile('|'.join(map(re.escape, _APT_INSTALL_STAGES)))
+_APT_REMOVE_STAGE_RE = re.compile('|'.join(map(re.escape, _APT_REMOVE_STAGES)))
+_APT_AUTOREMOVE_STAGE_RE = re.compile('|'.join(map(re.escape, _APT_AUTOREMOVE_STAGES)))
+# Minimum seconds between progress bar updates while streaming apt output.
+_PROGRESS_UPDATE_INTERVAL = 0.05
+
+# Extra subprocess.run options for read-only dpkg/apt queries. They never
+# read stdin, and every fd Python opens is non-inheritable (PEP 446), so
+# skipping close_fds is safe and lets the fork avoid walking the fd table.
+_QUERY_RUN_KWARGS: dict[str, Any] = {'stdin': subprocess.DEVNULL, 'close_fds': False}
+
+# `apt-cache depends` output: one "  Depends: pkg" / "  Recommends: pkg" line
+# per edge. Matched in a single scan instead of splitting line by line.
+_DEPENDS_RE = re.compile(r"(?m)^\s*(?:Depends|Recommends):\s*(\S+)")
+# `apt list --upgradable` rows ("pkg/suite version arch [...]"), scanned as
+# raw bytes; the "Listing..." header never matches.
+_UPGRADABLE_RE = re.compile(rb"(?m)^([a-z0-9][a-z0-9+\-.]+)/")
+# kali.org tool page parsing: package-looking text, a "Package: name" line
+# in the page text, sub-package anchors and tag separators.
+_PAGE_PKG_NAME_RE = re.compile(r"^[a-z0-9][a-z0-9+\-.]{2,}$")
+_PAGE_PACKAGE_FIELD_RE = re.compile(r"Package\s*:\s*([a-z0-9][a-z0-9+\-.]+)", re.IGNORECASE)
+# Same field matched directly in the raw page bytes, so the common
+# "Package: name" text needs no full-tree get_text() walk.
+_PAGE_PACKAGE_FIELD_BYTES_RE = re.compile(rb"Package\s*:\s*([a-z0-9][a-z0-9+\-.]+)", re.IGNORECASE)
+_PAGE_SUBPKG_RE = re.compile(r"^[a-z0-9][a-z0-9+\-.]{1,}$")
+_TAG_SEP_RE = re.compile(r"[;,]")
+_PAGE_PKG_LABELS = frozenset({'package', 'tool', 'name'})
+# Tool page tag keyword -> category. Longer keywords come before their
+# prefixes ("exploitation" before "exploit") so the alternation below
+# matches the most specific word at a given position.
+_PAGE_TAG_CATEGORIES = (
+    ('web', 'web'), ('crawler', 'web'), ('http', 'web'), ('recon', 'recon'),
+    ('enumeration', 'recon'), ('wireless', 'wireless'), ('wifi', 'wireless'),
+    ('forensics', 'forensics'), ('memory', 'forensics'), ('exploitation', 'exploitation'),
+    ('exploit', 'exploitation'), ('password', 'password'), ('cracking', 'password'),
+    ('bruteforce', 'password'), ('sniffing', 'sniffing'), ('capture', 'sniffing'),
+    ('reverse', 'reverse'), ('phishing', 'social'), ('social', 'social'),
+    ('database', 'database'), ('sql', 'database'),
+)
+
+
+_PAGE_TAG_KEYWORD_RE = re.compile('|'.join(re.escape(key) for key, _ in _PAGE_TAG_CATEGORIES))
+_PAGE_TAG_KEYWORD_CATEGORY = dict(_PAGE_TAG_CATEGORIES)
+
 
-def _atomic_write_json(path: Path, payload: Any, *, indent: int = 2) -> None:
-    """Write JSON to *path* atomically.
+def _category_from_tags(tags: Iterable[str]) -> str | None:
+    """Map the first tag containing a known keyword to its category.
 
-    Writes to a sibling temp file then ``os.replace``s it over the target so a
-    crash mid-write can never corrupt an existing cache/override file. The
-    parent directory is created if missing.
+    All tags are scanned in one regex pass; newline-joining keeps a keyword
+    from matching across two tags, and the leftmost hit wins.
+    """
+    match = _PAGE_TAG_KEYWORD_RE.search('\n'.join(tags))
+    return _PAGE_TAG_KEYWORD_CATEGORY[match.group()] if match else None
+
+
+def _parse_tool_page_html(tool_url: str, body: bytes) -> tuple[str, str | None, list[str]] | None:
+    """Parse a fetched tool page body; see ``_parse_tool_page_for_package``.
+
+    Module-level and stateless so discovery can run it in worker processes.
+    """
+    deps = _scraping_deps()
+    if deps is None:
+        return None
+    BeautifulSoup, parse_tool_page = deps
+    try:
+        # Extract package name from URL as fallback: /tools/toolname/ -> toolname
+        pkg_from_url = tool_url.rstrip('/').split('/')[-1]
+
+        # Build the tree once; the external parser and the fallback below
+        # both walk it instead of each parsing the page.
+        soup = BeautifulSoup(body, _HTML_PARSER)
+        if parse_tool_page:
+            parsed = parse_tool_page(body.decode('utf-8', 'replace'), soup=soup)
+            if parsed:
+                pkg, cat, _ = parsed
+                # External parser doesn't return subpackages, so return empty list
+                return pkg, cat, []
+        # Sub-package links look like /tools/<toolname>/#<packagename>, absolute
+        # (https://www.kali.org/tools/apache2/#apache2-bin) or relative.
+        base_path = f"/tools/{pkg_from_url}/#"
+        anchors: dict[str, None] = {}
+
+        # One document-order pass over <dt> and <a>: definition lists give the
+        # package (<dt>Package</dt><dd>name</dd>) and tags (<dt>Tags</dt>
+        # <dd>...</dd>); anchors give sub-packages.
+        pkg: str | None = None
+        category: str | None = None
+        saw_tags = False
+        for el in soup.find_all(('dt', 'a')):
+            if el.name == 'a':
+                href = el.get('href')
+                if href and base_path in href:
+                    anchor = href.split('#')[-1]
+                    if anchor and _PAGE_SUBPKG_RE.match(anchor):
+                        anchors[anchor] = None
+                continue
+            if pkg and category:
+                continue
+            label = el.get_text(strip=True).lower()
+            if pkg is None and label in _PAGE_PKG_LABELS:
+                dd = el.find_next('dd')
+                if dd:
+                    txt = dd.get_text(strip=True).lower()
+                    if _PAGE_PKG_NAME_RE.match(txt):
+                        pkg = txt
+            elif category is None and ('category' in label or 'tag' in label):
+                dd = el.find_next('dd')
+                if dd:
+                    # Collect all link texts or comma separated tokens
+                    tags = [a.get_text(strip=True).lower() for a in dd.find_all('a') if a.get_text(strip=True)]
+                    if not tags:
+                        raw = dd.get_text(" ", strip=True).lower()
+                        tags = [t.strip() for t in _TAG_SEP_RE.split(raw) if t.strip()]
+                    saw_tags = saw_tags or bool(tags)
+                    category = _category_from_tags(tags)
+        if not category and saw_tags:
+            category = 'other'
+        if not pkg:
+            # Fallback to textual regex search: the raw bytes first, the
+            # tag-stripped text only when markup splits the label.
+            m = _PAGE_PACKAGE_FIELD_BYTES_RE.search(body)
+            if m:
+                pkg = m.group(1).decode('ascii').lower()
+            else:
+                m = _PAGE_PACKAGE_FIELD_RE.search(soup.get_text('\n', strip=True))
+                if m:
+                    pkg = m.group(1).lower()
+
+        # If still no package found, use the tool name from URL
+        if not pkg:
+            pkg = pkg_from_url
+
+        # Only sub-packages that differ from the main package
+        subpackages = [anchor for anchor in anchors if anchor != pkg]
+
+        if not pkg:
+            return None
+        return pkg, category, subpackages
+    except Exception as e:
+        print(f"  └─ Parse error: {e}", file=sys.stderr)
+        return None
+
+
+# "Package:" field of an `apt-cache show` record.
+_PACKAGE_FIELD_RE = re.compile(r"(?m)^Package:\s*(\S+)")
+# Hard "Depends:" edge (alternatives and Recommends excluded); any ":arch"
+# qualifier is dropped.
+_DEPENDS_LINE_RE = re.compile(r"\s+Depends:\s*([^\s:]+)")
+# Nested meta packages to recurse into, and library-style packages to skip.
+_META_PKG_RE = re.compile(r"kali-(?:linux|tools)-")
+_DENY_PKG_RE = re.compile(r"lib|python|fonts-|firmware-|linux-headers-")
+# Packages never turned into category hints by _discover_meta_category_hints.
+_HINT_DENY_PREFIXES = ('fonts-', 'firmware-', 'lib', 'python', 'gir1.2-', 'doc-')
+# How long a successful `sudo -v` is trusted before re-validating. sudo's own
+# timestamp lasts several minutes, so this stays well inside it.
+_SUDO_VERIFY_TTL = 60.0
+# A background `apt-get update` started by discovery is reused by
+# check_updates for this long; older runs are refreshed in the foreground.
+_APT_UPDATE_REUSE_TTL = 900.0
+_APT_UPDATE_TIMEOUT = 240
+# Deadline for a single-package `apt-cache show` / `apt-cache depends`.
+_APT_QUERY_TIMEOUT = 5.0
+
+# `dpkg-query -W -f='${db:Status-Abbrev}\t${binary:Package}\n'` rows for
+# fully installed packages ("ii" = want install, state installed).
+_DPKG_INSTALLED_RE = re.compile(r"(?m)^ii\s*\t(\S+)$")
+_META_HARD_BLOCKLIST = frozenset({
+    "kali-linux-headless",
+    "kali-system-gui",
+    "kali-tools-top10",
+})
+
+
+@cache
+def _which(cmd: str) -> str | None:
+    """``shutil.which`` memoized per process; each miss stats every $PATH entry."""
+    return shutil.which(cmd)
+
+
+def _atomic_write_bytes(path: Path, blob: bytes) -> None:
+    """Write *blob* to *path* atomically.
+
+    The payload is written to a sibling temp file straight through the raw
+    descriptor (no buffered/text wrapper, typically a single ``write``), then
+    ``os.replace``d over the target so a crash mid-write can never corrupt an
+    existing cache/override file. The parent directory is created if missing.
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -236,13 +496,16 @@ def _atomic_write_json(path: Path, payload: Any, *, indent: int = 2) -> None:
     )
     tmp_path = Path(tmp_name)
     try:
-        with os.fdopen(tmp_fd, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=indent)
-            handle.flush()
+        try:
+            view = memoryview(blob)
+            while view:
+                view = view[os.write(tmp_fd, view):]
             try:
-                os.fsync(handle.fileno())
+                os.fsync(tmp_fd)
             except OSError:
                 pass
+        finally:
+            os.close(tmp_fd)
         os.replace(tmp_path, path)
     except Exception:
         try:
@@ -252,31 +515,133 @@ def _atomic_write_json(path: Path, payload: Any, *, indent: int = 2) -> None:
         raise
 
 
+def _atomic_write_json(path: Path, payload: Any, *, indent: int | None = 2) -> None:
+    """Encode *payload* once and write it with ``_atomic_write_bytes``.
+
+    ``indent=None`` writes compact JSON, meant for machine-only caches.
+    """
+    if orjson is not None and indent in (2, None):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        blob = orjson.dumps(payload, option=option)
+    elif indent is None:
+        blob = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    else:
+        blob = json.dumps(payload, indent=indent).encode("utf-8")
+    _atomic_write_bytes(path, blob)
+
+
 def _atomic_write_text(path: Path, text: str) -> None:
-    """Atomic text write, same semantics as ``_atomic_write_json``."""
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_fd, tmp_name = tempfile.mkstemp(
-        prefix=f".{path.name}.",
-        suffix=".tmp",
-        dir=str(path.parent),
-    )
-    tmp_path = Path(tmp_name)
+    """Atomic UTF-8 text write, same semantics as ``_atomic_write_bytes``."""
+    _atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def _iter_output_lines(stream: Any, chunk_size: int = 4096) -> Iterator[str]:
+    """Yield decoded lines from a binary subprocess pipe.
+
+    Reads whatever is available (up to *chunk_size* bytes) with ``os.read``
+    and splits it into lines, so a burst of apt output is handled in one
+    call instead of one buffered ``readline`` per line.
+    """
+    fd = stream.fileno()
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    pending = ''
+    while chunk := os.read(fd, chunk_size):
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split('\n')
+        for line in lines:
+            yield line + '\n'
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+def _stop_process(proc: subprocess.Popen, timeout: float = 5.0) -> None:
+    """Terminate *proc* if it is still running and reap it."""
+    if proc.poll() is not None:
+        return
+    proc.terminate()
     try:
-        with os.fdopen(tmp_fd, "w", encoding="utf-8") as handle:
-            handle.write(text)
-            handle.flush()
-            try:
-                os.fsync(handle.fileno())
-            except OSError:
-                pass
-        os.replace(tmp_path, path)
-    except Exception:
-        try:
-            tmp_path.unlink()
-        except OSError:
-            pass
-        raise
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+# --- Discovery concurrency ------------------------------------------------
+
+def _new_parse_pool() -> ProcessPoolExecutor | None:
+    """Process pool for tool page parsing, or ``None`` on a single core.
+
+    Workers start on the first submitted page, so runs served entirely from
+    the parse-result cache never spawn any. ``forkserver`` avoids forking
+    the threaded discovery process where the platform offers it.
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2:
+        return None
+    try:
+        import multiprocessing
+
+        method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+    except (ImportError, OSError, ValueError) as exc:
+        logger.debug("parse pool disabled: %s", exc)
+        return None
+
+
+class _PageFetchError(Exception):
+    """A tool page could not be fetched (as opposed to fetched but unparsable).
+
+    Only this outcome shrinks the discovery window in :class:`_SlowStartPool`;
+    a page without a detectable package says nothing about the host.
+    """
+
+
+class _SlowStartPool:
+    """Thread pool whose in-flight window adapts to how requests are faring.
+
+    Starts with two concurrent tasks and doubles the window after a full
+    window of successes (up to ``max_workers``); any failure halves it again.
+    This backs off on slow/erroring hosts without manual tuning while still
+    ramping up quickly on a fast link or a warm page cache.
+    """
+
+    def __init__(self, max_workers: int, *, initial: int = 2) -> None:
+        self.max_workers = max(1, max_workers)
+        self.floor = min(2, self.max_workers)
+        self.window = max(self.floor, min(initial, self.max_workers))
+
+    def run(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        *,
+        is_failure: Callable[[Any], bool] | None = None,
+    ) -> Iterator[tuple[Any, Future]]:
+        """Yield ``(item, future)`` pairs for ``fn(item)`` as they complete."""
+        queue = deque(items)
+        pending: dict[Future, Any] = {}
+        streak = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while queue or pending:
+                while queue and len(pending) < self.window:
+                    item = queue.popleft()
+                    pending[executor.submit(fn, item)] = item
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    failed = future.exception() is not None or bool(
+                        is_failure and is_failure(future.result())
+                    )
+                    if failed:
+                        self.window = max(self.floor, self.window // 2)
+                        streak = 0
+                    else:
+                        streak += 1
+                        if streak >= self.window:
+                            self.window = min(self.max_workers, self.window * 2)
+                            streak = 0
+                    yield item, future
 
 
 class KaliToolsManager:
@@ -284,7 +649,7 @@ class KaliToolsManager:
 
     def __init__(
         self,
-        discovery_workers: int = 8,
+        discovery_workers: int | None = None,
         discovery_delay: float = 0.2,
         debug_scraper: bool = False,
     ):
@@ -292,14 +657,60 @@ class KaliToolsManager:
         # perform a full discovery pass (web + meta-packages), then
         # persist results to JSON for future runs.
 
-        self.discovery_workers = max(2, discovery_workers)
+        # None sizes the pool from the usable CPUs (or KALITOOLS_MAX_WORKERS);
+        # an explicit count, even 1, is honoured as given.
+        self.discovery_workers = max(1, discovery_workers or default_workers())
         self.discovery_delay = max(0.0, discovery_delay)
         self.debug_scraper = debug_scraper
+        # Freshness window for cached kali.org pages (see http_util.cached_get)
+        self.page_cache_ttl = PAGE_CACHE_TTL
 
         # Load canonical Kali tools index from web cache if present (best-effort)
-        self.web_index: dict[str, Any] | None = self._load_web_index()
+        # Discovery only needs membership tests, so the lower-cased names are
+        # kept as a frozenset next to the raw (as-loaded) index.
+        self._web_index_keys: frozenset[str]
+        self.web_index: dict[str, Any]
+        self._web_index_keys, self.web_index = self._load_web_index()
         # Initialize caches that discovery helpers might touch
         self._installed_cache: set[str] | None = None
+        # time.monotonic() of the last successful `sudo -v`; None until one
+        # succeeds (monotonic() starts near zero at boot, so 0.0 would look
+        # recent).
+        self._sudo_verified_at: float | None = None
+        # name -> Tool index kept in step with self.tools (rebuilt by
+        # _prepare_tools, updated in place by discovery/removal).
+        self._tools_by_name: dict[str, Tool] = {}
+        # Same index keyed on Tool.name_lower for case-insensitive lookups.
+        self._tools_by_lower_name: dict[str, Tool] = {}
+        # id(tool) -> (tool, keyword haystack); dropped whenever the tool is
+        # re-normalized, which is the only place its searchable fields change.
+        self._haystack_cache: dict[int, tuple[Tool, str]] = {}
+        # tool page URL -> [body digest, package, category, subpackages];
+        # persisted in kali_site_cache.json so unchanged pages skip parsing.
+        self._page_parse_cache: dict[str, list[Any]] = {}
+        # name_lower -> (sources version, inputs, inferred category/subcategory)
+        # for _infer_metadata_for_tool. Bump _inference_version whenever the
+        # hint sources change to invalidate every entry at once.
+        self._inference_cache: dict[str, tuple[int, tuple[str, str, str], tuple[str, str]]] = {}
+        self._inference_version = 0
+        # Bumped by mark_tools_changed(); get_statistics and tool_table()
+        # reuse their last result while the version is unchanged.
+        self._tools_version = 0
+        self._stats_cache: tuple[int, dict] | None = None
+        self._tool_table: tuple[int, ToolTable] | None = None
+        # `apt-get update` run by start_background_apt_update() and its
+        # monotonic start time; check_updates waits on it instead of
+        # starting its own.
+        self._apt_update_proc: subprocess.Popen | None = None
+        self._apt_update_started = 0.0
+        # Worker processes that parse tool pages during discover_from_kali_site,
+        # which owns (and shuts down) the pool. Fetch threads only raise the
+        # disabled flag when it breaks, so the rest of the run parses inline.
+        self._parse_pool: ProcessPoolExecutor | None = None
+        self._parse_pool_disabled = False
+        # Set by _load_tools_from_json when every file it read was written by
+        # _save_tools_to_json after normalization.
+        self._json_normalized = False
 
         loaded = self._load_tools_from_json()
         if loaded:
@@ -331,12 +742,11 @@ class KaliToolsManager:
                 console.print("[dim]Checking meta-packages for additional tools...[/dim]")
                 # Add tools from meta-packages to existing web-discovered tools
                 meta_discovered = self._discover_tools_from_meta_packages()
-                existing_names = {t.name for t in self.tools}
                 added_count = 0
                 for tool in meta_discovered:
-                    if tool.name not in existing_names:
+                    if self._tools_by_name.setdefault(tool.name, tool) is tool:
+                        self._tools_by_lower_name.setdefault(tool.name_lower, tool)
                         self.tools.append(tool)
-                        existing_names.add(tool.name)
                         added_count += 1
                 if added_count > 0:
                     console.print(f"[green]✓ Added {added_count} tools from meta-packages[/green]")
@@ -349,7 +759,8 @@ class KaliToolsManager:
             # Ensure we have persisted whatever we discovered so that
             # subsequent runs load purely from JSON.
             try:
-                self._save_tools_to_json(self.tools)
+                # Not yet normalized: that happens in _prepare_tools below.
+                self._save_tools_to_json(self.tools, normalized=False)
                 console.print(f"[green]✓ Saved {len(self.tools)} tools to data/tools_merged.json[/green]")
             except Exception as e:
                 console.print(f"[yellow]⚠️  Could not save tools: {e}[/yellow]")
@@ -357,12 +768,15 @@ class KaliToolsManager:
             # Clear screen after discovery to prepare for UI display
             console.clear()
 
+        # Every loader/discovery path yields Tool instances; coerce any stray
+        # mapping once here so the per-tool passes below stay monomorphic.
+        self.tools = [t if isinstance(t, Tool) else Tool.from_dict(t) for t in self.tools]
+
         self.cache_file = Path.home() / ".kali_tools_cache.json"
         self.local_repo_file = Path.home() / ".kali_tools_local_repo.txt"
         self.installation_status = {}
         self.config_manager = ConfigManager(self.tools)
         self.load_cache()
-        self._categorize_tools()
         self.category_override_file = Path.home() / ".kali_tools_overrides.json"
         self.category_overrides: dict[str, dict[str, str]] = {}
         self.category_overrides = self._load_category_overrides()
@@ -373,8 +787,12 @@ class KaliToolsManager:
             if hints:
                 self.meta_category_hints = hints
                 self._save_meta_category_cache(hints)
-        self._apply_metadata_enrichment()
+        self._inference_version += 1
+        # Our own normalized JSON only needs hints/overrides re-applied.
+        self._prepare_tools(normalize=not (loaded and self._json_normalized))
         self._load_local_repo()
+        # package -> description; '' records a package apt-cache has no
+        # description for, so it is not queried again.
         self.description_cache: dict[str, str] = {}
         self._dependency_cache: dict[str, list[str]] = {}
         self._package_size_cache: dict[str, int] = {}
@@ -387,27 +805,27 @@ class KaliToolsManager:
         except Exception:
             pass
 
-    def _load_web_index(self) -> dict[str, Any] | None:
+    def _load_web_index(self) -> tuple[frozenset[str], dict[str, Any]]:
         """Load canonical tools index discovered from Kali website, if available.
 
-        Expects a JSON object mapping normalized tool names to any metadata
-        (typically written by discover_from_kali_site). Missing or invalid
-        files are ignored.
+        Expects a JSON object mapping tool names to any metadata (typically
+        written by discover_from_kali_site). Returns the lower-cased name set
+        plus the raw mapping; missing or invalid files yield empty values.
         """
+        empty: tuple[frozenset[str], dict[str, Any]] = (frozenset(), {})
         try:
             base_dir = Path(__file__).resolve().parent
             data_dir = base_dir / "data"
             index_file = data_dir / "kali_web_index.json"
             if not index_file.exists():
-                return None
-            with open(index_file, encoding="utf-8") as f:
-                data = json.load(f)
+                return empty
+            data = _json_loads(index_file.read_bytes())
             if isinstance(data, dict):
-                # Normalize keys to lowercase strings
-                return {str(k).lower(): v for k, v in data.items()}
+                # JSON object keys are always strings already
+                return frozenset(map(str.lower, data)), data
         except Exception:
-            return None
-        return None
+            return empty
+        return empty
 
     def refresh_tools_from_sources(self) -> int:
         """Rebuild tools list from JSON and any available discovery sources.
@@ -418,26 +836,27 @@ class KaliToolsManager:
           3. Merge and persist the combined list back to a JSON file.
 
         Returns the number of *new* tools detected compared to the current list.
+        When discovery finds nothing new the current list is left untouched
+        (no JSON reload, re-normalization or save).
         """
         try:
-            existing_names = {t['name'] for t in self.tools}
-            base_tools = self._load_tools_from_json() or []
+            previous = self._tools_by_name
 
             # Discover additional tools from Kali meta-packages (best-effort)
             discovered = self._discover_tools_from_meta_packages()
+            if not any(tool.name not in previous for tool in discovered):
+                return 0
+
+            base_tools = self._load_tools_from_json() or []
 
             # Merge by name, preferring existing JSON definitions when present
-            merged: dict[str, Tool] = {t['name']: t for t in base_tools}
+            merged: dict[str, Tool] = {t.name: t for t in base_tools}
             for tool in discovered:
-                name = tool['name']
-                if name not in merged:
-                    merged[name] = tool
+                merged.setdefault(tool.name, tool)
 
             self.tools = list(merged.values())
-            self._categorize_tools()
-            new_names = {t['name'] for t in self.tools}
-            added_names = new_names - existing_names
-            added = len(added_names)
+            self._prepare_tools()
+            added = sum(1 for name in self._tools_by_name if name not in previous)
             # Update config manager with new tool set
             self.config_manager = ConfigManager(self.tools)
 
@@ -465,72 +884,71 @@ class KaliToolsManager:
         visited_meta: set[str] = set()
         discovered: dict[str, Tool] = {}
 
-        deny_prefixes = (
-            "lib",
-            "python",
-            "fonts-",
-            "firmware-",
-            "linux-headers-",
-        )
-        hard_blocklist = {
-            "kali-linux-headless",
-            "kali-system-gui",
-            "kali-tools-top10",
-        }
-
-        web_index = self.web_index or {}
+        web_index = self._web_index_keys
         alias_map = {
             "metasploit-framework": "metasploit",
         }
 
-        while meta_roots:
-            meta = meta_roots.popleft()
-            if meta in visited_meta or not meta:
-                continue
-            visited_meta.add(meta)
-            try:
-                result = subprocess.run(
-                    ["apt-cache", "depends", meta],
-                    capture_output=True,
-                    text=True,
-                    timeout=20,
-                )
-            except Exception:
-                continue
-
-            if result.returncode != 0:
-                continue
-
-            for line in result.stdout.splitlines():
-                line = line.strip()
-                if not line.startswith(("Depends:", "Recommends:")):
-                    continue
-                pkg = line.split(":", 1)[-1].strip()
-                if not pkg or pkg in hard_blocklist:
-                    continue
-                if pkg.startswith(("kali-linux-", "kali-tools-")):
-                    if pkg not in visited_meta:
-                        meta_roots.append(pkg)
-                    continue
-                if pkg.startswith(deny_prefixes):
-                    continue
-                if pkg in discovered:
-                    continue
-
-                norm = pkg.lower()
-                norm = alias_map.get(norm, norm)
-                if web_index and norm not in web_index:
-                    continue
+        with ThreadPoolExecutor(max_workers=self.discovery_workers) as pool:
+            while meta_roots:
+                batch: list[str] = []
+                while meta_roots:
+                    meta = meta_roots.popleft()
+                    if meta and meta not in visited_meta:
+                        visited_meta.add(meta)
+                        batch.append(meta)
+                if not batch:
+                    break
 
-                discovered[pkg] = Tool(name=pkg, commands=[pkg], installed=False, category="other", size=0)
+                # Split the frontier into contiguous chunks resolved by
+                # concurrent `apt-cache depends` processes; map() keeps the
+                # chunk order so discovery order matches the serial walk.
+                size = -(-len(batch) // min(self.discovery_workers, len(batch)))
+                chunks = [batch[i:i + size] for i in range(0, len(batch), size)]
+                for output in pool.map(self._apt_cache_depends, chunks):
+                    for pkg in _DEPENDS_RE.findall(output):
+                        if pkg in discovered or pkg in _META_HARD_BLOCKLIST:
+                            continue
+                        if _META_PKG_RE.match(pkg):
+                            if pkg not in visited_meta:
+                                meta_roots.append(pkg)
+                            continue
+                        if _DENY_PKG_RE.match(pkg):
+                            continue
+
+                        # Debian package names are already lower-case.
+                        norm = alias_map.get(pkg, pkg)
+                        if web_index and norm not in web_index:
+                            continue
+
+                        discovered[pkg] = Tool(name=pkg, commands=[pkg], installed=False, category="other", size=0)
 
         return list(discovered.values())
 
-    def _save_tools_to_json(self, tools: list[Tool]) -> None:
+    @staticmethod
+    def _apt_cache_depends(packages: list[str], timeout: float = 20) -> str:
+        """Return raw ``apt-cache depends`` output for *packages* ('' on failure)."""
+        try:
+            result = subprocess.run(
+                ["apt-cache", "depends", *packages],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                **_QUERY_RUN_KWARGS,
+            )
+        except Exception:
+            return ""
+        # A single unknown package makes apt-cache exit non-zero while still
+        # printing the others, so keep whatever output we got.
+        return result.stdout or ""
+
+    def _save_tools_to_json(self, tools: list[Tool], *, normalized: bool = True) -> None:
         """Persist the merged tools list to a primary JSON file.
 
         This writes to `data/tools_merged.json`, creating the `data` directory
-        if needed. Only basic fields are stored for now.
+        if needed. Only basic fields are stored for now. ``normalized`` marks
+        lists that already went through ``_prepare_tools`` so the next load
+        can skip re-normalizing them.
         """
         try:
             base_dir = Path(__file__).resolve().parent
@@ -543,6 +961,7 @@ class KaliToolsManager:
                     "type": "merged",
                     "notes": "Produced by KaliToolsManager discovery pipeline.",
                 },
+                "normalized": normalized,
                 "tools": [t.to_dict() for t in tools],
             }
             _atomic_write_json(out_file, payload)
@@ -551,18 +970,18 @@ class KaliToolsManager:
 
     def _looks_like_fallback_dataset(self, tools: list[Tool]) -> bool:
         """Detect whether the provided tools match the built-in fallback list."""
+        if not tools or len(tools) > _FALLBACK_MAX_LEN:
+            return False
         names: set[str] = set()
         for tool in tools:
             if isinstance(tool, Tool):
-                name = tool.name
+                name = tool.name_lower
             else:
-                name = str(tool.get('name', '')).strip()  # type: ignore[attr-defined]
+                name = str(tool.get('name', '')).strip().lower()  # type: ignore[attr-defined]
             if not name:
                 return False
-            names.add(name.lower())
-        if not names:
-            return False
-        return any(names == variant for variant in FALLBACK_NAME_VARIANTS)
+            names.add(name)
+        return names in FALLBACK_NAME_VARIANTS
 
     def _parse_tools_data(self) -> list[Tool]:
         """Return a minimal built-in tool list for fully offline scenarios."""
@@ -574,31 +993,35 @@ class KaliToolsManager:
         This is a logical removal from the manager's view (and JSON), not an
         uninstall from the system.
         """
-        original_len = len(self.tools)
-        self.tools = [t for t in self.tools if t['name'] != tool_name]
-        if len(self.tools) < original_len:
-            self._save_tools_to_json(self.tools)
-            self.config_manager = ConfigManager(self.tools)
-            return True
-        return False
+        removed = self._tools_by_name.pop(tool_name, None)
+        if removed is None:
+            return False
+        if self._tools_by_lower_name.get(removed.name_lower) is removed:
+            del self._tools_by_lower_name[removed.name_lower]
+        self._haystack_cache.pop(id(removed), None)
+        self.tools = [t for t in self.tools if t is not removed]
+        self.mark_tools_changed()
+        self._save_tools_to_json(self.tools)
+        self.config_manager = ConfigManager(self.tools)
+        return True
     def _check_system_requirements(self):
         """Check if system meets requirements on startup"""
         if not self.is_debian_based():
             console.print("[yellow]⚠️  Warning: This tool is designed for Debian/Ubuntu-based systems (Kali Linux)[/yellow]")
             console.print("[dim]Some features may not work correctly on other distributions[/dim]\n")
 
-        if not shutil.which('apt-get'):
+        if not _which('apt-get'):
             console.print("[red]❌ Error: apt-get not found![/red]")
             console.print("[yellow]This tool requires apt-get package manager[/yellow]\n")
 
-        if not shutil.which('dpkg'):
+        if not _which('dpkg'):
             console.print("[red]❌ Error: dpkg not found![/red]")
             console.print("[yellow]This tool requires dpkg package manager[/yellow]\n")
 
     def is_debian_based(self) -> bool:
         """Check if system is Debian-based"""
         try:
-            return bool(shutil.which('apt-get') and shutil.which('dpkg'))
+            return bool(_which('apt-get') and _which('dpkg'))
         except Exception:
             return False
 
@@ -613,10 +1036,12 @@ class KaliToolsManager:
         session.
         """
         try:
-            if not shutil.which('sudo'):
+            if not _which('sudo'):
                 console.print("[red]❌ Error: sudo command not found![/red]")
                 console.print("[yellow]Please install sudo: apt install sudo[/yellow]")
                 return False
+            if self._sudo_recently_verified():
+                return True
 
             try:
                 result = subprocess.run(
@@ -638,8 +1063,18 @@ class KaliToolsManager:
             console.print(f"[yellow]⚠️  Warning: Could not verify sudo access: {e}[/yellow]")
             return True
 
+    def _sudo_recently_verified(self) -> bool:
+        verified_at = self._sudo_verified_at
+        return verified_at is not None and time.monotonic() - verified_at < _SUDO_VERIFY_TTL
+
     def verify_sudo_before_operation(self) -> bool:
-        """Verify sudo access before performing privileged operations"""
+        """Verify sudo access before performing privileged operations.
+
+        A successful check is remembered for ``_SUDO_VERIFY_TTL`` seconds so
+        back-to-back privileged operations do not re-run ``sudo -v``.
+        """
+        if self._sudo_recently_verified():
+            return True
         try:
             result = subprocess.run(
                 ['sudo', '-v'],  # Refresh sudo timestamp
@@ -649,6 +1084,7 @@ class KaliToolsManager:
             )
 
             if result.returncode == 0:
+                self._sudo_verified_at = time.monotonic()
                 return True
             else:
                 console.print("[red]❌ Sudo authentication failed![/red]")
@@ -685,13 +1121,15 @@ class KaliToolsManager:
                 return []
 
             tools: list[Tool] = []
+            all_normalized = True
             for json_file in sorted(data_dir.glob("tools_*.json")):
                 try:
-                    with open(json_file, encoding="utf-8") as f:
-                        payload = json.load(f)
+                    payload = _json_loads(json_file.read_bytes())
                 except Exception as e:
                     console.print(f"[yellow]⚠️ Could not read {json_file.name}: {e}[/yellow]")
                     continue
+                if not (isinstance(payload, dict) and payload.get("normalized") is True):
+                    all_normalized = False
 
                 entries: list[Any]
                 if isinstance(payload, list):
@@ -717,55 +1155,58 @@ class KaliToolsManager:
                         continue
                     tools.append(tool)
 
+            self._json_normalized = all_normalized and bool(tools)
             return tools
         except Exception as e:
             console.print(f"[yellow]⚠️ Error loading JSON tools: {e}[/yellow]")
             return []
 
 
-    def _categorize_tools(self):
-        """Normalize tool metadata (category, subcategory, description, commands)."""
-        lookup = self._build_category_lookup()
-        for idx, raw_tool in enumerate(self.tools):
-            tool = raw_tool
-            if not isinstance(tool, Tool):
-                tool = Tool.from_dict(tool)  # type: ignore[arg-type]
-                self.tools[idx] = tool
-            self._normalize_tool_entry(tool, lookup)
-
-    @staticmethod
-    def _build_category_lookup() -> dict[str, str]:
-        lookup: dict[str, str] = {}
-        for category, names in CATEGORIES.items():
-            for name in names:
-                lookup[name.lower()] = category
-        return lookup
+    def _prepare_tools(self, *, enrich: bool = True, normalize: bool = True) -> None:
+        """Normalize every tool and, with *enrich*, apply hints/overrides.
 
-    @staticmethod
-    def _dedupe_preserve_order(values: list[str]) -> list[str]:
-        seen: set[str] = set()
-        result: list[str] = []
-        for value in values:
-            text = str(value or '').strip()
-            if not text:
-                continue
-            key = text.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            result.append(text)
-        return result
+        Normalization, heuristic inference and user overrides run back to
+        back per tool in a single pass, and the derived ``icon`` /
+        ``category_display`` metadata is written once at the end. ``enrich``
+        is disabled for callers that run before hints/overrides are loaded;
+        ``normalize`` is skipped for lists loaded from our own normalized JSON.
+        """
+        self._haystack_cache.clear()
+        by_name: dict[str, Tool] = {}
+        by_lower_name: dict[str, Tool] = {}
+        for tool in self.tools:
+            if normalize:
+                self._normalize_tool_entry(tool, TOOL_TO_CATEGORY)
+            by_name.setdefault(tool.name, tool)
+            by_lower_name.setdefault(tool.name_lower, tool)
+            if enrich:
+                self._infer_metadata_for_tool(tool, refresh=False)
+                self._apply_override_to_tool(tool, refresh=False)
+                self._refresh_tool_metadata(tool)
+            elif tool.name:
+                # Cache commonly used metadata hints for UI renderers
+                icon = CATEGORY_ICONS.get(tool.category or 'other', CATEGORY_ICONS['other'])
+                tool.metadata.setdefault('icon', icon)
+                tool.metadata.setdefault('category_display', get_category_display_name(tool.category))
+        self._tools_by_name = by_name
+        self._tools_by_lower_name = by_lower_name
+        self.mark_tools_changed()
+
+    def mark_tools_changed(self) -> None:
+        """Invalidate derived views (statistics, tool table) after tools were modified."""
+        self._tools_version += 1
 
     def _normalize_tool_entry(self, tool: Tool, lookup: dict[str, str]) -> None:
+        self._haystack_cache.pop(id(tool), None)
         tool.name = tool.name.strip()
+        tool.name_lower = name_lower = tool.name.lower()
         if not tool.name:
             return
 
-        tool.commands = self._dedupe_preserve_order(tool.commands or [tool.name])
-        if tool.name and not any(cmd.lower() == tool.name.lower() for cmd in tool.commands):
-            tool.commands.insert(0, tool.name)
+        # Same single forward pass as Tool.__init__: the name is seeded first.
+        tool.commands = Tool._normalize_list(tool.commands, prepend=tool.name)
 
-        mapped_category = lookup.get(tool.name.lower())
+        mapped_category = lookup.get(name_lower)
         current_category = (tool.category or '').strip().lower()
         if mapped_category and (current_category in ('', 'other') or current_category not in CATEGORY_NAMES):
             tool.category = mapped_category
@@ -780,27 +1221,20 @@ class KaliToolsManager:
         if not tool.description:
             tool.description = TOOL_DESCRIPTIONS.get(tool.name, '')
 
-        tool.subpackages = self._dedupe_preserve_order(tool.subpackages)
+        tool.subpackages = Tool._normalize_list(tool.subpackages)
 
-        # Cache commonly used metadata hints for UI renderers
-        icon = CATEGORY_ICONS.get(tool.category or 'other', CATEGORY_ICONS['other'])
-        tool.metadata.setdefault('icon', icon)
-        tool.metadata.setdefault('category_display', get_category_display_name(tool.category))
-
-    def _apply_metadata_enrichment(self) -> None:
-        """Enhance category/subcategory metadata via heuristics and overrides."""
-        for idx, entry in enumerate(self.tools):
-            tool = entry
-            if not isinstance(tool, Tool):
-                tool = Tool.from_dict(entry)  # type: ignore[arg-type]
-                self.tools[idx] = tool
-            self._infer_metadata_for_tool(tool)
-            self._apply_override_to_tool(tool)
-
-    def _infer_metadata_for_tool(self, tool: Tool) -> None:
+    def _infer_metadata_for_tool(self, tool: Tool, *, refresh: bool = True) -> None:
         haystack = self._build_metadata_haystack(tool)
+        inputs = (tool.category, tool.subcategory, haystack)
+        cached = self._inference_cache.get(tool.name_lower)
+        if cached is not None and cached[0] == self._inference_version and cached[1] == inputs:
+            tool.category, tool.subcategory = cached[2]
+            if refresh:
+                self._refresh_tool_metadata(tool)
+            return
+
         current_category = (tool.category or '').lower()
-        meta_hint = self.meta_category_hints.get(tool.name.lower())
+        meta_hint = self.meta_category_hints.get(tool.name_lower)
         if meta_hint:
             hinted_category = meta_hint.get('category')
             hinted_subcategory = meta_hint.get('subcategory')
@@ -831,10 +1265,14 @@ class KaliToolsManager:
                 if default_sub:
                     tool.subcategory = default_sub
 
-        self._refresh_tool_metadata(tool)
+        self._inference_cache[tool.name_lower] = (
+            self._inference_version, inputs, (tool.category, tool.subcategory),
+        )
+        if refresh:
+            self._refresh_tool_metadata(tool)
 
-    def _apply_override_to_tool(self, tool: Tool) -> None:
-        override = self.category_overrides.get(tool.name.lower())
+    def _apply_override_to_tool(self, tool: Tool, *, refresh: bool = True) -> None:
+        override = self.category_overrides.get(tool.name_lower)
         if not override:
             return
 
@@ -851,34 +1289,39 @@ class KaliToolsManager:
                 if inferred:
                     tool.subcategory = inferred
 
-        self._refresh_tool_metadata(tool)
+        if refresh:
+            self._refresh_tool_metadata(tool)
 
     def _build_metadata_haystack(self, tool: Tool) -> str:
+        cached = self._haystack_cache.get(id(tool))
+        if cached is not None and cached[0] is tool:
+            return cached[1]
         parts: list[str] = [tool.name, ' '.join(tool.commands or []), tool.description, ' '.join(tool.subpackages or [])]
         meta_keywords = tool.metadata.get('keywords') if isinstance(tool.metadata, dict) else None  # type: ignore[arg-type]
         if isinstance(meta_keywords, list):
             parts.append(' '.join(str(item) for item in meta_keywords if item))
         elif isinstance(meta_keywords, str):
             parts.append(meta_keywords)
-        return ' '.join(part for part in parts if part).lower()
+        haystack = ' '.join(part for part in parts if part).lower()
+        self._haystack_cache[id(tool)] = (tool, haystack)
+        return haystack
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _match_category_from_keywords(haystack: str) -> str | None:
-        for category, keywords in CATEGORY_KEYWORD_HINTS.items():
-            for keyword in keywords:
-                if keyword.lower() in haystack:
-                    return category
+        for category, pattern in CATEGORY_KEYWORD_PATTERNS:
+            if pattern.search(haystack):
+                return category
         return None
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _match_subcategory_from_keywords(category: str | None, haystack: str) -> str | None:
         if not category:
             return None
-        mapping = SUBCATEGORY_KEYWORD_HINTS.get((category or '').lower(), {})
-        for subcategory, keywords in mapping.items():
-            for keyword in keywords:
-                if keyword.lower() in haystack:
-                    return subcategory
+        for subcategory, pattern in SUBCATEGORY_KEYWORD_PATTERNS.get(category.lower(), ()):
+            if pattern.search(haystack):
+                return subcategory
         return None
 
     def _refresh_tool_metadata(self, tool: Tool) -> None:
@@ -897,8 +1340,7 @@ class KaliToolsManager:
         if not self.category_override_file.exists():
             return {}
         try:
-            with open(self.category_override_file, encoding='utf-8') as handle:
-                raw_data = json.load(handle)
+            raw_data = _json_loads(Path(self.category_override_file).read_bytes())
         except Exception as exc:
             console.print(f"[yellow]⚠️ Could not read category overrides: {exc}[/yellow]")
             return {}
@@ -946,36 +1388,41 @@ class KaliToolsManager:
     def _load_meta_category_cache(self, ttl_hours: int = 240) -> dict[str, dict[str, str]]:
         if not hasattr(self, 'meta_hint_cache_file'):
             return {}
-        cache_path = self.meta_hint_cache_file
-        if not cache_path.exists():
+        cache_path = Path(self.meta_hint_cache_file)
+        # The file is rewritten atomically on every save, so its mtime is the
+        # cache timestamp; an expired cache is rejected without parsing it.
+        try:
+            mtime = cache_path.stat().st_mtime
+        except OSError:
+            return {}
+        if ttl_hours > 0 and (time.time() - mtime) > (ttl_hours * 3600):
             return {}
         try:
-            with open(cache_path, encoding='utf-8') as handle:
-                data = json.load(handle)
+            data = _json_loads(cache_path.read_bytes())
         except Exception:
             return {}
 
-        timestamp = float(data.get('timestamp', 0) or 0)
-        if ttl_hours > 0 and timestamp:
-            if (time.time() - timestamp) > (ttl_hours * 3600):
-                return {}
-
         raw_hints = data.get('hints') or {}
         if not isinstance(raw_hints, dict):
             return {}
 
+        # The cache is written by _save_meta_category_cache, so entries are
+        # normally clean already: keys are JSON strings and categories valid
+        # slugs. Only values that fail the fast checks are re-normalized.
         normalized: dict[str, dict[str, str]] = {}
         for name, payload in raw_hints.items():
-            category = ''
             subcategory = ''
             if isinstance(payload, dict):
-                category = str(payload.get('category', '') or '').strip().lower()
-                subcategory = str(payload.get('subcategory', '') or '').strip()
+                category = payload.get('category') or ''
+                sub_raw = payload.get('subcategory') or ''
+                subcategory = sub_raw.strip() if isinstance(sub_raw, str) else str(sub_raw).strip()
             else:
-                category = str(payload or '').strip().lower()
-            if category not in CATEGORY_NAMES:
-                category = 'other'
-            normalized[str(name).lower()] = {
+                category = payload or ''
+            if not isinstance(category, str) or category not in CATEGORY_NAMES:
+                category = str(category).strip().lower()
+                if category not in CATEGORY_NAMES:
+                    category = 'other'
+            normalized[name.lower()] = {
                 'category': category,
                 'subcategory': subcategory,
             }
@@ -989,62 +1436,42 @@ class KaliToolsManager:
             'hints': hints,
         }
         try:
-            _atomic_write_json(Path(self.meta_hint_cache_file), payload)
+            _atomic_write_json(Path(self.meta_hint_cache_file), payload, indent=None)
         except Exception as exc:
             console.print(f"[yellow]⚠️ Could not persist meta category cache: {exc}[/yellow]")
 
     def _discover_meta_category_hints(self) -> dict[str, dict[str, str]]:
         hints: dict[str, dict[str, str]] = {}
-        if not shutil.which('apt-cache'):
+        if not _which('apt-cache'):
             return hints
 
-        deny_prefixes = ('fonts-', 'firmware-', 'lib', 'python', 'gir1.2-', 'doc-')
-
-        for meta_pkg, mapping in META_CATEGORY_SOURCES.items():
-            if isinstance(mapping, tuple):
-                category, subcategory_default = mapping
-            else:
-                category = mapping
-                subcategory_default = ''
-            try:
-                result = subprocess.run(
-                    ['apt-cache', 'depends', meta_pkg],
-                    capture_output=True,
-                    text=True,
-                    timeout=20,
-                )
-            except Exception:
-                continue
-            if result.returncode != 0:
-                continue
-
-            slug = category if category in CATEGORY_NAMES else 'other'
-            for line in result.stdout.splitlines():
-                text_line = line.strip()
-                if not text_line.startswith(('Depends:', 'Recommends:')):
-                    continue
-                pkg = text_line.split(':', 1)[-1].strip()
-                if not pkg or pkg.startswith('kali-tools-') or pkg.startswith('kali-linux-'):
-                    continue
-                if pkg.startswith(deny_prefixes):
-                    continue
-                hints.setdefault(pkg.lower(), {
-                    'category': slug,
-                    'subcategory': subcategory_default,
-                })
+        sources = list(META_CATEGORY_SOURCES.items())
+        if not sources:
+            return hints
+        # apt-cache calls are I/O bound and independent, so run them side by
+        # side. map() keeps results in META_CATEGORY_SOURCES order, which the
+        # first-source-wins setdefault below relies on.
+        with ThreadPoolExecutor(max_workers=min(8, len(sources))) as pool:
+            outputs = pool.map(self._apt_cache_depends, [[meta_pkg] for meta_pkg, _ in sources])
+            for (_meta_pkg, mapping), output in zip(sources, outputs, strict=True):
+                if isinstance(mapping, tuple):
+                    category, subcategory_default = mapping
+                else:
+                    category = mapping
+                    subcategory_default = ''
+                slug = category if category in CATEGORY_NAMES else 'other'
+                for pkg in _DEPENDS_RE.findall(output):
+                    if _META_PKG_RE.match(pkg) or pkg.startswith(_HINT_DENY_PREFIXES):
+                        continue
+                    hints.setdefault(pkg.lower(), {
+                        'category': slug,
+                        'subcategory': subcategory_default,
+                    })
         return hints
 
     def _lookup_tool_name(self, key: str) -> str | None:
-        key = (key or '').lower()
-        for tool in self.tools:
-            name = ''
-            try:
-                name = tool['name']  # type: ignore[index]
-            except Exception:
-                name = getattr(tool, 'name', '')
-            if name and name.lower() == key:
-                return name
-        return None
+        tool = self._tools_by_lower_name.get((key or '').lower())
+        return tool.name if tool is not None else None
 
     def set_tool_category_override(
         self,
@@ -1061,9 +1488,10 @@ class KaliToolsManager:
         if category is None:
             if key in self.category_overrides:
                 self.category_overrides.pop(key, None)
-                tool = next((t for t in self.tools if getattr(t, 'name', '').lower() == key), None)
+                tool = self._tools_by_lower_name.get(key)
                 if tool:
                     self._infer_metadata_for_tool(tool)
+                    self.mark_tools_changed()
             self._save_category_overrides()
             return
 
@@ -1079,7 +1507,7 @@ class KaliToolsManager:
             'original_name': normalized,
         }
 
-        tool = next((t for t in self.tools if getattr(t, 'name', '').lower() == key), None)
+        tool = self._tools_by_lower_name.get(key)
         if tool:
             tool.category = category_slug
             if sub_text:
@@ -1088,6 +1516,7 @@ class KaliToolsManager:
                 inferred = self._match_subcategory_from_keywords(category_slug, self._build_metadata_haystack(tool))
                 tool.subcategory = inferred or get_subcategory_for(tool.name, category_slug) or ''
             self._refresh_tool_metadata(tool)
+            self.mark_tools_changed()
 
         self._save_category_overrides()
 
@@ -1151,20 +1580,24 @@ class KaliToolsManager:
 
     def load_cache(self):
         """Load cached installation status"""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file) as f:
-                    self.installation_status = json.load(f)
-                for tool in self.tools:
-                    tool.installed = self.installation_status.get(tool.name, False)
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not load cache: {e}[/yellow]")
+        # Opening directly (instead of exists() then open) saves a stat call.
+        try:
+            self.installation_status = _json_loads(Path(self.cache_file).read_bytes())
+            for tool in self.tools:
+                tool.installed = self.installation_status.get(tool.name, False)
+            self.mark_tools_changed()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not load cache: {e}[/yellow]")
 
     def save_cache(self):
         """Save installation status to cache"""
+        # Every installed/size change is followed by a save.
+        self.mark_tools_changed()
         try:
             self.installation_status = {tool.name: tool.installed for tool in self.tools}
-            _atomic_write_json(Path(self.cache_file), self.installation_status)
+            _atomic_write_json(Path(self.cache_file), self.installation_status, indent=None)
         except Exception as e:
             console.print(f"[yellow]Warning: Could not save cache: {e}[/yellow]")
 
@@ -1173,61 +1606,69 @@ class KaliToolsManager:
         if self._installed_cache is not None and not force:
             return self._installed_cache
 
-        installed: set[str] = set()
-        try:
-            result = subprocess.run(['dpkg', '-l'], capture_output=True, text=True, timeout=15)
-            for line in result.stdout.splitlines():
-                if line.startswith('ii'):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        installed.add(parts[1])
-        except Exception as exc:
-            logger.debug("dpkg cache refresh failed: %s", exc)
-
-        self._installed_cache = installed
-        return installed
+        self._installed_cache = self._prime_installed_cache()
+        return self._installed_cache
 
-    def check_installation(self, package_name: str) -> bool:
-        """Check if a package is installed using dpkg"""
-        installed_cache = self.refresh_installed_cache()
-        if installed_cache:
-            return package_name in installed_cache
-        try:
-            result = subprocess.run(
-                ['dpkg', '-l', package_name],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return 'ii' in result.stdout and package_name in result.stdout
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+    @staticmethod
+    def _prime_installed_cache() -> set[str]:
+        """Return every installed package name from a single dpkg-query run.
 
-    def get_dependencies(self, package_name: str) -> list[str]:
-        """Get package dependencies"""
-        if package_name in self._dependency_cache:
-            return self._dependency_cache[package_name]
+        Asks dpkg for just the status abbreviation and package name (instead
+        of the wide ``dpkg -l`` table) and extracts the ``ii`` rows with one
+        regex scan over the output.
+        """
         try:
             result = subprocess.run(
-                ['apt-cache', 'depends', package_name],
+                ['dpkg-query', '-W', '-f=${db:Status-Abbrev}\t${binary:Package}\n'],
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=15,
+                **_QUERY_RUN_KWARGS,
             )
+        except Exception as exc:
+            logger.debug("dpkg cache refresh failed: %s", exc)
+            return set()
+        return set(_DPKG_INSTALLED_RE.findall(result.stdout))
 
-            if result.returncode != 0:
-                return []
+    def check_installation(self, package_name: str) -> bool:
+        """Check if a package is installed using the cached dpkg listing.
 
-            dependencies = []
-            for line in result.stdout.split('\n'):
-                if line.strip().startswith('Depends:'):
-                    dep = line.split(':')[1].strip()
-                    dependencies.append(dep)
+        An empty listing is a valid answer (nothing installed, or dpkg is
+        unavailable), so no per-package ``dpkg -l`` fallback is spawned.
+        """
+        return package_name in self.refresh_installed_cache()
 
-            self._dependency_cache[package_name] = dependencies
-            return dependencies
-        except Exception:
-            return []
+    def get_dependencies(self, package_name: str) -> list[str]:
+        """Get package dependencies"""
+        if package_name not in self._dependency_cache:
+            self.prewarm_dependencies([package_name])
+        return self._dependency_cache.get(package_name, [])
+
+    def prewarm_dependencies(self, package_names: Iterable[str]) -> None:
+        """Fill the dependency cache for *package_names* with one apt-cache run.
+
+        ``apt-cache depends`` accepts many packages and prints one section per
+        package (header line at column 0, indented edges below it), so a bulk
+        install pays for a single fork instead of one per package. Unknown
+        packages (and a failed run) get no section and are cached as having
+        no dependencies, so they are not looked up again.
+        """
+        pending = {name: None for name in package_names if name not in self._dependency_cache}
+        if not pending or not _which('apt-cache'):
+            return
+        timeout = _APT_QUERY_TIMEOUT if len(pending) == 1 else 20
+        current: list[str] | None = None
+        for line in self._apt_cache_depends(list(pending), timeout).splitlines():
+            if not line:
+                continue
+            if not line[0].isspace():
+                current = self._dependency_cache.setdefault(line, []) if line in pending else None
+            elif current is not None:
+                match = _DEPENDS_LINE_RE.match(line)
+                if match:
+                    current.append(match.group(1))
+        for name in pending:
+            self._dependency_cache.setdefault(name, [])
 
     def get_package_size(self, package_name: str) -> int:
         """Get installed package size in bytes"""
@@ -1242,6 +1683,32 @@ class KaliToolsManager:
         self._package_size_cache[package_name] = size
         return size
 
+    def _bulk_load_installed_sizes(self) -> dict[str, int]:
+        """Load installed sizes for every package with one dpkg-query run.
+
+        Results (in bytes) are merged into ``_package_size_cache`` and also
+        returned. Packages reporting no size are left out so
+        ``get_package_size`` can still fall back to the repository size.
+        """
+        try:
+            result = subprocess.run(
+                ['dpkg-query', '-W', '-f=${Package}\t${Installed-Size}\n'],
+                capture_output=True,
+                text=True,
+                timeout=15,
+                **_QUERY_RUN_KWARGS,
+            )
+        except Exception as exc:
+            logger.debug("bulk size query failed: %s", exc)
+            return {}
+        sizes: dict[str, int] = {}
+        for line in result.stdout.splitlines():
+            name, _, size_kb = line.partition('\t')
+            if size_kb.isdigit() and size_kb != '0':
+                sizes[name] = int(size_kb) * 1024
+        self._package_size_cache.update(sizes)
+        return sizes
+
     def _query_installed_size(self, package_name: str) -> int:
         try:
             result = subprocess.run(
@@ -1249,6 +1716,7 @@ class KaliToolsManager:
                 capture_output=True,
                 text=True,
                 timeout=5,
+                **_QUERY_RUN_KWARGS,
             )
         except FileNotFoundError:
             return 0
@@ -1272,6 +1740,7 @@ class KaliToolsManager:
                 capture_output=True,
                 text=True,
                 timeout=7,
+                **_QUERY_RUN_KWARGS,
             )
         except FileNotFoundError:
             return 0
@@ -1292,33 +1761,28 @@ class KaliToolsManager:
         return 0
 
     def scan_all_tools(self) -> tuple[int, int]:
-        """Fast scan of all tools using single dpkg -l parse (no per-package calls)."""
-        installed_count = 0
-        try:
-            result = subprocess.run(['dpkg', '-l'], capture_output=True, text=True, timeout=15)
-            lines = result.stdout.splitlines()
-            installed_set = set()
-            for line in lines:
-                if line.startswith('ii'):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        installed_set.add(parts[1])
+        """Fast scan of all tools using a single dpkg-query run (no per-package calls)."""
+        installed_set = self.refresh_installed_cache(force=True)
+        sizes = self._bulk_load_installed_sizes()
+
+        def apply(tool: Tool) -> bool:
+            tool.installed = tool.name in installed_set
+            if tool.installed:
+                size = sizes.get(tool.name)
+                tool.size = size if size is not None else self.get_package_size(tool.name)
+            return tool.installed
 
+        try:
+            installed_count = 0
             with _cyber_progress(console=console) as progress:
                 task = progress.add_task('🔍 Scanning installed packages (dpkg cache)...', total=len(self.tools))
                 for tool in self.tools:
-                    tool.installed = tool.name in installed_set
-                    if tool.installed:
-                        installed_count += 1
-                        tool.size = self.get_package_size(tool.name)
+                    installed_count += apply(tool)
                     progress.update(task, advance=1)
-            self._installed_cache = installed_set
         except Exception:
-            for tool in self.tools:
-                tool.installed = self.check_installation(tool.name)
-                if tool.installed:
-                    installed_count += 1
-                    tool.size = self.get_package_size(tool.name)
+            # Progress display failed; finish without it, reusing the same
+            # dpkg snapshot instead of querying per package.
+            installed_count = sum(apply(tool) for tool in self.tools)
 
         self.save_cache()
         return installed_count, len(self.tools)
@@ -1335,12 +1799,8 @@ class KaliToolsManager:
 
     def check_disk_space(self, required_mb: int = 100) -> bool:
         """Check if sufficient disk space is available"""
-        if not PSUTIL_AVAILABLE:
-            return True  # Can't check, assume OK
-
         try:
-            disk = psutil.disk_usage('/')
-            available_mb = disk.free / 1024 / 1024
+            available_mb = shutil.disk_usage('/').free >> 20
 
             if available_mb < required_mb + 500:  # 500MB safety buffer
                 console.print("[red]❌ Insufficient disk space![/red]")
@@ -1365,14 +1825,15 @@ class KaliToolsManager:
             if not self.verify_sudo_before_operation():
                 console.print("[red]❌ Cannot proceed without sudo privileges[/red]")
                 return False
+            self.finish_background_apt_update()
 
-            tool = next((t for t in self.tools if t['name'] == package_name), None)
+            tool = self._tools_by_name.get(package_name)
             if not tool:
                 console.print(f"[red]❌ Tool '{package_name}' not found in database![/red]")
                 console.print("[dim]Tip: Use 'S' to search for similar tools[/dim]")
                 return False
 
-            if tool['installed']:
+            if tool.installed:
                 console.print(f"[yellow]ℹ️  {package_name} is already installed![/yellow]")
                 return False
 
@@ -1396,33 +1857,37 @@ class KaliToolsManager:
                     self._build_apt_install_cmd(package_name),
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1
+                    bufsize=0
                 )
 
                 progress_value = 0
+                shown = 0
                 line_count = 0
-                for line in process.stdout:
+                last_update = 0.0
+                for line in _iter_output_lines(process.stdout):
+                    if shown >= 95:
+                        # The line estimate caps at 95 and no stage goes
+                        # higher, so the rest of the output is just drained.
+                        continue
                     line_count += 1
-                    if 'Reading package lists' in line or 'Reading' in line:
-                        progress_value = max(progress_value, 15)
-                    elif 'Building dependency tree' in line or 'Building' in line:
-                        progress_value = max(progress_value, 25)
-                    elif 'Reading state information' in line or 'state' in line:
-                        progress_value = max(progress_value, 35)
-                    elif 'Need to get' in line or 'Get:' in line:
-                        progress_value = max(progress_value, 45)
-                    elif 'Unpacking' in line or 'Selecting' in line:
-                        progress_value = max(progress_value, 60)
-                    elif 'Setting up' in line or 'Preparing' in line:
-                        progress_value = max(progress_value, 80)
-                    elif 'Processing triggers' in line or 'triggers' in line:
-                        progress_value = max(progress_value, 90)
-
-                    estimated_progress = min(95, 5 + (line_count * 2))
-                    progress_value = max(progress_value, estimated_progress)
-
-                    progress.update(task, completed=progress_value)
+                    stage = _APT_INSTALL_STAGE_RE.search(line)
+                    if stage:
+                        stage_progress = _APT_INSTALL_STAGES[stage.group()]
+                        if stage_progress > progress_value:
+                            progress_value = stage_progress
+
+                    estimated_progress = 5 + line_count * 2
+                    if estimated_progress > 95:
+                        estimated_progress = 95
+                    if estimated_progress > progress_value:
+                        progress_value = estimated_progress
+
+                    if progress_value != shown:
+                        now = time.monotonic()
+                        if now - last_update >= _PROGRESS_UPDATE_INTERVAL:
+                            progress.update(task, completed=progress_value)
+                            shown = progress_value
+                            last_update = now
 
                 process.wait()
                 progress.update(task, completed=100)
@@ -1433,10 +1898,8 @@ class KaliToolsManager:
             success = result_code == 0
 
             if success:
-                for tool in self.tools:
-                    if tool['name'] == package_name:
-                        tool['installed'] = True
-                        tool['size'] = self.get_package_size(package_name)
+                tool.installed = True
+                tool.size = self.get_package_size(package_name)
 
                 self.save_cache()
                 self._installed_cache = None
@@ -1449,8 +1912,8 @@ class KaliToolsManager:
                     logger.debug('state record failed: %s', exc)
                 console.print(f"\n[green]✅ {package_name} installed successfully in {elapsed_time:.1f}s![/green]")
 
-                if tool['commands']:
-                    console.print(f"[cyan]💡 Available commands: {', '.join(tool['commands'][:3])}[/cyan]")
+                if tool.commands:
+                    console.print(f"[cyan]💡 Available commands: {', '.join(tool.commands[:3])}[/cyan]")
 
                 if notifications_ready():
                     send_notification(
@@ -1497,6 +1960,7 @@ class KaliToolsManager:
             if not self.verify_sudo_before_operation():
                 console.print("[red]❌ Cannot proceed without sudo privileges[/red]")
                 return False
+            self.finish_background_apt_update()
 
             console.print(f"\n[yellow]Uninstalling {package_name}...[/yellow]")
             console.print("[dim]This requires sudo privileges[/dim]\n")
@@ -1510,32 +1974,38 @@ class KaliToolsManager:
                     ['sudo', 'apt-get', 'remove', '-y', package_name],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1
+                    bufsize=0
                 )
 
                 progress_value = 0
+                shown = 0
                 captured_lines: deque[str] = deque(maxlen=60)
                 line_count = 0
+                last_update = 0.0
 
-                for line in process.stdout:
+                for line in _iter_output_lines(process.stdout):
                     captured_lines.append(line)
+                    if shown >= 95:
+                        continue
                     line_count += 1
-                    if 'Reading package lists' in line or 'Reading' in line:
-                        progress_value = max(progress_value, 20)
-                    elif 'Building dependency tree' in line or 'Building' in line:
-                        progress_value = max(progress_value, 35)
-                    elif 'Reading state information' in line or 'state' in line:
-                        progress_value = max(progress_value, 50)
-                    elif 'Removing' in line or 'Purging' in line:
-                        progress_value = max(progress_value, 75)
-                    elif 'Processing triggers' in line or 'triggers' in line:
-                        progress_value = max(progress_value, 90)
-
-                    estimated_progress = min(95, 10 + (line_count * 3))
-                    progress_value = max(progress_value, estimated_progress)
-
-                    progress.update(task, completed=progress_value)
+                    stage = _APT_REMOVE_STAGE_RE.search(line)
+                    if stage:
+                        stage_progress = _APT_REMOVE_STAGES[stage.group()]
+                        if stage_progress > progress_value:
+                            progress_value = stage_progress
+
+                    estimated_progress = 10 + line_count * 3
+                    if estimated_progress > 95:
+                        estimated_progress = 95
+                    if estimated_progress > progress_value:
+                        progress_value = estimated_progress
+
+                    if progress_value != shown:
+                        now = time.monotonic()
+                        if now - last_update >= _PROGRESS_UPDATE_INTERVAL:
+                            progress.update(task, completed=progress_value)
+                            shown = progress_value
+                            last_update = now
 
                 process.wait()
                 stderr_output = ''.join(captured_lines)
@@ -1560,21 +2030,21 @@ class KaliToolsManager:
                                 ['sudo', 'apt-get', 'autoremove', '-y', package_name],
                                 stdout=subprocess.PIPE,
                                 stderr=subprocess.STDOUT,
-                                text=True,
-                                bufsize=1
+                                bufsize=0
                             )
 
                             progress_value = 0
                             force_captured: deque[str] = deque(maxlen=60)
-                            for line in process.stdout:
+                            last_update = 0.0
+                            for line in _iter_output_lines(process.stdout):
                                 force_captured.append(line)
-                                if 'Reading' in line:
-                                    progress_value = 20
-                                elif 'Removing' in line:
-                                    progress_value = 60
-                                elif 'Processing' in line:
-                                    progress_value = 90
-                                progress.update(task, completed=progress_value)
+                                stage = _APT_AUTOREMOVE_STAGE_RE.search(line)
+                                if stage:
+                                    progress_value = _APT_AUTOREMOVE_STAGES[stage.group()]
+                                now = time.monotonic()
+                                if now - last_update >= _PROGRESS_UPDATE_INTERVAL:
+                                    progress.update(task, completed=progress_value)
+                                    last_update = now
 
                             process.wait()
                             stderr_output = ''.join(force_captured)
@@ -1599,10 +2069,10 @@ class KaliToolsManager:
 
             elapsed_time = time.time() - start_time
 
-            for tool in self.tools:
-                if tool['name'] == package_name:
-                    tool['installed'] = False
-                    tool['size'] = 0
+            tool = self._tools_by_name.get(package_name)
+            if tool is not None:
+                tool.installed = False
+                tool.size = 0
 
             self.save_cache()
             self._installed_cache = None
@@ -1634,6 +2104,7 @@ class KaliToolsManager:
             return False
         if not self.verify_sudo_before_operation():
             return False
+        self.finish_background_apt_update()
         try:
             rc = subprocess.run(
                 ['sudo', 'apt-mark', 'hold', package_name]
@@ -1659,6 +2130,7 @@ class KaliToolsManager:
             return False
         if not self.verify_sudo_before_operation():
             return False
+        self.finish_background_apt_update()
         try:
             rc = subprocess.run(
                 ['sudo', 'apt-mark', 'unhold', package_name]
@@ -1683,6 +2155,7 @@ class KaliToolsManager:
             res = subprocess.run(
                 ['apt-mark', 'showhold'],
                 capture_output=True, text=True, timeout=10,
+                **_QUERY_RUN_KWARGS,
             )
             if res.returncode != 0:
                 return []
@@ -1690,21 +2163,12 @@ class KaliToolsManager:
         except Exception:
             return []
 
-    def check_updates(self, progress_callback: Callable[[str, int, int], None] | None = None) -> list[str]:
-        """Check for available package updates with optional progress reporting."""
-
-        def emit(message: str, completed: int, total: int) -> None:
-            if progress_callback:
-                try:
-                    progress_callback(message, completed, total)
-                    return
-                except Exception:
-                    pass
-            console.print(f"[cyan]{message}[/cyan]")
-
-        steps_total = 3
-        emit("Refreshing package lists...", 0, steps_total)
+    def _apt_update_cmd(self, *, non_interactive: bool = False) -> list[str]:
+        """Build the `apt-get update` command, adding sudo when not root.
 
+        ``non_interactive`` makes sudo fail instead of prompting, for runs
+        that are not attached to the terminal.
+        """
         update_cmd = ['apt-get']
         local_list = Path("/etc/apt/sources.list.d/local.list")
         if self.local_repo and is_offline_mode() and local_list.exists():
@@ -1720,31 +2184,113 @@ class KaliToolsManager:
                 is_root = geteuid() == 0
             except Exception:
                 is_root = False
-        if not is_root and shutil.which('sudo'):
-            update_cmd.insert(0, 'sudo')
+        if not is_root and _which('sudo'):
+            update_cmd[:0] = ['sudo', '-n'] if non_interactive else ['sudo']
+        return update_cmd
+
+    def start_background_apt_update(self) -> bool:
+        """Start `apt-get update` in the background for a later check_updates.
 
+        Lets the apt mirror round-trips overlap other network work such as
+        kali.org discovery. sudo is run with ``-n`` so a missing cached
+        credential fails quietly and check_updates falls back to its own
+        foreground run. Returns True if a run is (already) in flight.
+        """
+        if self._apt_update_proc is not None and self._apt_update_proc.poll() is None:
+            return True
+        if not _which('apt-get'):
+            return False
         try:
-            update_proc = subprocess.run(
-                update_cmd,
-                capture_output=True,
-                text=True,
-                timeout=240,
+            self._apt_update_proc = subprocess.Popen(
+                self._apt_update_cmd(non_interactive=True),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
+        except OSError as exc:
+            logger.debug("background apt-get update failed to start: %s", exc)
+            self._apt_update_proc = None
+            return False
+        self._apt_update_started = time.monotonic()
+        # Never leave an unconsumed run behind when the CLI exits.
+        atexit.register(_stop_process, self._apt_update_proc)
+        return True
+
+    def _await_background_apt_update(self) -> bool | None:
+        """Wait for a recent background `apt-get update`, consuming it.
+
+        Returns True if it refreshed the lists, False if there was none (or
+        it failed or is too old to trust), and None on timeout.
+        """
+        proc, self._apt_update_proc = self._apt_update_proc, None
+        if proc is None:
+            return False
+        if time.monotonic() - self._apt_update_started > _APT_UPDATE_REUSE_TTL:
+            _stop_process(proc)
+            return False
+        try:
+            return proc.wait(timeout=_APT_UPDATE_TIMEOUT) == 0
         except subprocess.TimeoutExpired:
-            console.print("[red]apt-get update timed out after 4 minutes.[/red]")
-            return []
-        except Exception as e:
-            console.print(f"[red]Failed to run {' '.join(update_cmd)}: {e}[/red]")
-            return []
+            proc.kill()
+            proc.wait()
+            return None
 
-        if update_proc.returncode != 0:
-            stderr = (update_proc.stderr or '').strip().splitlines()[:3]
-            if stderr:
-                joined = "\n  ".join(stderr)
-                console.print(
-                    f"[yellow]apt-get update reported issues:\n  {joined}[/yellow]"
-                )
+    def finish_background_apt_update(self) -> None:
+        """Let a background `apt-get update` finish before another apt run.
+
+        Called ahead of privileged apt/dpkg operations so they never overlap
+        the run started by discovery (both would contend for apt's locks).
+        """
+        proc = self._apt_update_proc
+        if proc is None:
+            return
+        if proc.poll() is None:
+            console.print("[dim]Waiting for the background apt-get update to finish...[/dim]")
+        self._await_background_apt_update()
+
+    def check_updates(self, progress_callback: Callable[[str, int, int], None] | None = None) -> list[str]:
+        """Check for available package updates with optional progress reporting."""
+
+        def emit(message: str, completed: int, total: int) -> None:
+            if progress_callback:
+                try:
+                    progress_callback(message, completed, total)
+                    return
+                except Exception:
+                    pass
+            console.print(f"[cyan]{message}[/cyan]")
+
+        steps_total = 3
+        emit("Refreshing package lists...", 0, steps_total)
+
+        refreshed = self._await_background_apt_update()
+        if refreshed is None:
+            console.print(f"[red]apt-get update timed out after {_APT_UPDATE_TIMEOUT // 60} minutes.[/red]")
             return []
+        if not refreshed:
+            update_cmd = self._apt_update_cmd()
+            try:
+                update_proc = subprocess.run(
+                    update_cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=_APT_UPDATE_TIMEOUT,
+                )
+            except subprocess.TimeoutExpired:
+                console.print(f"[red]apt-get update timed out after {_APT_UPDATE_TIMEOUT // 60} minutes.[/red]")
+                return []
+            except Exception as e:
+                console.print(f"[red]Failed to run {' '.join(update_cmd)}: {e}[/red]")
+                return []
+
+            if update_proc.returncode != 0:
+                stderr = (update_proc.stderr or '').strip().splitlines()[:3]
+                if stderr:
+                    joined = "\n  ".join(stderr)
+                    console.print(
+                        f"[yellow]apt-get update reported issues:\n  {joined}[/yellow]"
+                    )
+                return []
 
         emit("Scanning upgradable packages...", 1, steps_total)
 
@@ -1752,8 +2298,8 @@ class KaliToolsManager:
             result = subprocess.run(
                 ['apt', 'list', '--upgradable'],
                 capture_output=True,
-                text=True,
                 timeout=30,
+                **_QUERY_RUN_KWARGS,
             )
         except subprocess.TimeoutExpired:
             console.print("[red]'apt list --upgradable' timed out.[/red]")
@@ -1768,12 +2314,12 @@ class KaliToolsManager:
 
         emit("Processing results...", 2, steps_total)
 
+        known = self._tools_by_name
         upgradable = []
-        for line in result.stdout.split('\n')[1:]:  # Skip header
-            if line.strip() and '/' in line:
-                package = line.split('/')[0].strip()
-                if any(t['name'] == package for t in self.tools):
-                    upgradable.append(package)
+        for match in _UPGRADABLE_RE.finditer(result.stdout):
+            package = match.group(1).decode('ascii')
+            if package in known:
+                upgradable.append(package)
 
         emit("Update check complete", steps_total, steps_total)
         return upgradable
@@ -1785,7 +2331,8 @@ class KaliToolsManager:
                 ['apt-cache', 'show', package_name],
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=5,
+                **_QUERY_RUN_KWARGS,
             )
             return result.stdout if result.returncode == 0 else None
         except Exception:
@@ -1801,50 +2348,47 @@ class KaliToolsManager:
         return cache_dir / 'kali_site_cache.json'
 
     def _load_kali_site_cache(self) -> dict[str, Any] | None:
-        path = self._kali_site_cache_path()
-        if path.exists():
-            try:
-                with open(path) as f:
-                    return json.load(f)
-            except Exception:
-                return None
-        return None
+        try:
+            return _json_loads(self._kali_site_cache_path().read_bytes())
+        except Exception:
+            return None
 
     def _save_kali_site_cache(self, data: dict[str, Any]):
         try:
-            _atomic_write_json(self._kali_site_cache_path(), data)
+            _atomic_write_json(self._kali_site_cache_path(), data, indent=None)
         except Exception:
             logger.exception("Failed to persist kali.org site cache")
 
     def _fetch_kali_tool_links(self, max_pages: int = 5) -> list[str]:
         """Return list of tool page URLs from kali.org/tools/all-tools/."""
-        if not WEB_SCRAPING_AVAILABLE or requests is None or BeautifulSoup is None:
+        deps = _scraping_deps()
+        if deps is None:
             return []
-        from .http_util import polite_get
+        BeautifulSoup = deps[0]
+        from .http_util import cached_get
 
         base = 'https://www.kali.org'
         urls: list[str] = []
         try:
             index_url = f"{base}/tools/all-tools/"
 
-            if self.discovery_delay:
-                time.sleep(self.discovery_delay)
-            resp = polite_get(index_url, timeout=15)
-            if resp is None or resp.status_code != 200:
+            body = cached_get(
+                index_url, ttl=self.page_cache_ttl, timeout=15, delay=self.discovery_delay
+            )
+            if body is None:
                 return []
 
-            soup = BeautifulSoup(resp.content, 'html.parser')
-
             # Debug counters
             total_links = 0
             tools_links = 0
             sample_hrefs = []
+            # Insertion-ordered set of tool page URLs
+            found: dict[str, None] = {}
 
             # Find all links that point to individual tool pages
             # Pattern: /tools/<toolname>/ (exactly 3 parts, ending with /)
             # or /tools/<toolname>/#<anchor> (for sub-packages)
-            for a in soup.find_all('a', href=True):
-                href = a['href']
+            for href in _iter_hrefs(body, BeautifulSoup):
                 total_links += 1
 
                 # Collect sample hrefs for debugging
@@ -1863,33 +2407,33 @@ class KaliToolsManager:
                         parts = [p for p in path.split('/') if p]
                         # Should be ['tools', '<toolname>']
                         if len(parts) == 2 and parts[0] == 'tools':
-                            if clean_href not in urls:
-                                urls.append(clean_href)
+                            found.setdefault(clean_href, None)
+
+            urls = list(found)
 
             # Debug output to file - always write, even if successful
             if self.debug_scraper:
                 try:
-                    import os
-                    debug_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'debug_scraper.txt')
-                    with open(debug_path, 'w', encoding='utf-8') as debug_f:
-                        debug_f.write(f"[DEBUG] Total links found: {total_links}\n")
-                        debug_f.write(f"[DEBUG] Links with /tools/ in them: {tools_links}\n")
-                        debug_f.write(f"[DEBUG] Unique tool URLs extracted: {len(urls)}\n\n")
-                        debug_f.write("[DEBUG] Sample of first 50 hrefs:\n")
-                        for href in sample_hrefs:
-                            debug_f.write(f"  {href}\n")
-                        debug_f.write("\n")
-                        if len(urls) < 500:
-                            debug_f.write("[DEBUG] URLs extracted:\n")
-                            for url in urls:
-                                debug_f.write(f"  {url}\n")
-                    logger.info("Debug scraper log written to %s", debug_path)
+                    lines = [
+                        f"[DEBUG] Total links found: {total_links}",
+                        f"[DEBUG] Links with /tools/ in them: {tools_links}",
+                        f"[DEBUG] Unique tool URLs extracted: {len(urls)}",
+                        "",
+                        "[DEBUG] Sample of first 50 hrefs:",
+                        *(f"  {href}" for href in sample_hrefs),
+                        "",
+                    ]
+                    if len(urls) < 500:
+                        lines.append("[DEBUG] URLs extracted:")
+                        lines.extend(f"  {url}" for url in urls)
+                    lines.append("")
+                    _DEBUG_SCRAPER_PATH.write_text("\n".join(lines), encoding='utf-8')
+                    logger.info("Debug scraper log written to %s", _DEBUG_SCRAPER_PATH)
                 except Exception as ex:
                     logger.debug("Failed to write debug scraper log: %s", ex)
 
         except Exception as e:
             # Log error for debugging but don't crash
-            import sys
             print(f"[Warning] Error fetching tool links: {e}", file=sys.stderr)
             import traceback
             traceback.print_exc(file=sys.stderr)
@@ -1902,168 +2446,125 @@ class KaliToolsManager:
         """Return (package_name, category, subpackages_list) parsed from a tool page URL.
 
         Subpackages are related packages shown on the tool page (e.g., apache2-bin, apache2-dev for apache2).
+        Returns ``None`` when the page has no detectable package and raises
+        :class:`_PageFetchError` when it could not be fetched at all.
         """
-        if not WEB_SCRAPING_AVAILABLE or requests is None or BeautifulSoup is None:
+        deps = _scraping_deps()
+        if deps is None:
             return None
-        from .http_util import polite_get
+        from .http_util import cached_get
 
         try:
-            if self.discovery_delay:
-                time.sleep(self.discovery_delay)
-            resp = polite_get(tool_url, timeout=10)
-            if resp is None or resp.status_code != 200:
-                return None
-
-            # Extract package name from URL as fallback: /tools/toolname/ -> toolname
-            pkg_from_url = tool_url.rstrip('/').split('/')[-1]
-
-            if parse_tool_page:
-                parsed = parse_tool_page(resp.text)
-                if parsed:
-                    pkg, cat, _ = parsed
-                    # External parser doesn't return subpackages, so return empty list
-                    return pkg, cat, []
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            package_candidates: list[str] = []
-            subpackages: list[str] = []
-
-            # Prefer structured data: look for definition lists <dl><dt>Package</dt><dd>name</dd>
-            for dl in soup.find_all('dl'):
-                dts = dl.find_all('dt')
-                for dt in dts:
-                    label = dt.get_text(strip=True).lower()
-                    if label in {'package','tool','name'}:
-                        dd = dt.find_next('dd')
-                        if dd:
-                            txt = dd.get_text(strip=True).lower()
-                            if re.match(r'^[a-z0-9][a-z0-9+\-.]{2,}$', txt):
-                                package_candidates.append(txt)
-            pkg = package_candidates[0] if package_candidates else None
-            if not pkg:
-                # Fallback to textual regex search
-                text = soup.get_text('\n', strip=True)
-                m = re.search(r'Package\s*:\s*([a-z0-9][a-z0-9+\-.]+)', text, re.IGNORECASE)
-                if m:
-                    pkg = m.group(1).lower()
-
-            # If still no package found, use the tool name from URL
-            if not pkg:
-                pkg = pkg_from_url
-
-            # Extract sub-packages from the page
-            # Look for links with href pattern: /tools/<toolname>/#<packagename> (absolute or relative)
-            # From the webpage, links look like: https://www.kali.org/tools/apache2/#apache2-bin
-            base_path = f"/tools/{pkg_from_url}/#"
-            base_path_abs = f"https://www.kali.org/tools/{pkg_from_url}/#"
-
-            for a in soup.find_all('a', href=True):
-                href = a['href']
-                # Check if this is a sub-package link (has anchor pointing to same tool page)
-                if base_path in href or base_path_abs in href:
-                    # Extract package name from anchor
-                    anchor = href.split('#')[-1]
-                    # Validate it looks like a package name
-                    if anchor and re.match(r'^[a-z0-9][a-z0-9+\-.]{1,}$', anchor):
-                        # Only add if it's different from the main package
-                        if anchor != pkg and anchor not in subpackages:
-                            subpackages.append(anchor)
-
-            # Category / tags parsing
-            category = None
-            tag_values: list[str] = []
-            for dl in soup.find_all('dl'):
-                for dt in dl.find_all('dt'):
-                    label = dt.get_text(strip=True).lower()
-                    if any(k in label for k in ( 'category','tags','tag')):
-                        dd = dt.find_next('dd')
-                        if dd:
-                            # Collect all link texts or comma separated tokens
-                            links = [a.get_text(strip=True).lower() for a in dd.find_all('a') if a.get_text(strip=True)]
-                            if links:
-                                tag_values.extend(links)
-                            else:
-                                raw = dd.get_text(" ", strip=True).lower()
-                                tag_values.extend([t.strip() for t in re.split(r'[;,]', raw) if t.strip()])
-            # Map first meaningful tag to category set if possible
-            mapping = {
-                'web':'web','crawler':'web','http':'web','recon':'recon','enumeration':'recon','wireless':'wireless','wifi':'wireless',
-                'forensics':'forensics','memory':'forensics','exploitation':'exploitation','exploit':'exploitation','password':'password',
-                'cracking':'password','bruteforce':'password','sniffing':'sniffing','capture':'sniffing','reverse':'reverse','phishing':'social',
-                'social':'social','database':'database','sql':'database'
-            }
-            for tag in tag_values:
-                for key, cat in mapping.items():
-                    if key in tag:
-                        category = cat
-                        break
-                if category:
-                    break
-            if not category and tag_values:
-                category = 'other'
-            if not pkg:
-                return None
-            return pkg, category, subpackages
+            body = cached_get(
+                tool_url, ttl=self.page_cache_ttl, timeout=10, delay=self.discovery_delay
+            )
         except Exception as e:
-            import sys
-            print(f"  └─ Parse error: {e}", file=sys.stderr)
-            return None
+            print(f"  └─ Fetch error: {e}", file=sys.stderr)
+            raise _PageFetchError(str(e)) from e
+        if body is None:
+            raise _PageFetchError("fetch failed")
+
+        # An unchanged page body parses to the same result as last time.
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        cached = self._page_parse_cache.get(tool_url)
+        if cached and cached[0] == digest:
+            return cached[1], cached[2], list(cached[3])
+        parsed = self._parse_page_body(tool_url, body)
+        if parsed is not None:
+            self._page_parse_cache[tool_url] = [digest, *parsed]
+        return parsed
+
+    def _parse_page_body(self, tool_url: str, body: bytes) -> tuple[str, str | None, list[str]] | None:
+        """Parse *body* in the discovery process pool, or inline without one.
+
+        Soup construction is CPU-bound and holds the GIL, so with the pool the
+        fetch threads keep downloading while other cores parse.
+        """
+        pool = self._parse_pool
+        if pool is not None and not self._parse_pool_disabled:
+            try:
+                return pool.submit(_parse_tool_page_html, tool_url, body).result()
+            except (BrokenProcessPool, OSError) as exc:
+                logger.debug("parse pool unavailable, parsing inline: %s", exc)
+                self._parse_pool_disabled = True
+        return _parse_tool_page_html(tool_url, body)
 
-    def discover_from_kali_site(self, ttl_hours: int = 168) -> list[str]:
+    def discover_from_kali_site(self, ttl_hours: int = 168, *, force_rescrape: bool = False) -> list[str]:
         """Discover and add tools based only on the Kali tools website.
 
+        Pages are served from the on-disk page cache when younger than
+        ``ttl_hours``; ``force_rescrape`` ignores both the link cache and the
+        page cache and fetches everything again.
+
         Returns list of newly added package names.
         """
+        self.page_cache_ttl = 0.0 if force_rescrape else ttl_hours * 3600.0
+        # Overlap the apt mirror refresh with the kali.org fetches below.
+        if not is_offline_mode():
+            self.start_background_apt_update()
         # Use cache first
-        cache = self._load_kali_site_cache()
+        cache = None if force_rescrape else self._load_kali_site_cache()
+        if not isinstance(cache, dict):
+            cache = {}
+        pages = cache.get('pages')
+        self._page_parse_cache = pages if isinstance(pages, dict) else {}
         now = time.time()
+        links_ts = cache.get('timestamp', 0)
         urls: list[str] = []
-        added: list[str] = []
-        if cache and isinstance(cache, dict):
-            ts = cache.get('timestamp', 0)
-            if (now - ts) < (ttl_hours * 3600):
-                urls = cache.get('tool_urls', []) or []
+        if (now - links_ts) < (ttl_hours * 3600):
+            urls = cache.get('tool_urls', []) or []
         if not urls:
             urls = self._fetch_kali_tool_links(max_pages=5)
+            links_ts = now
             if urls:
                 self._save_kali_site_cache({'timestamp': now, 'tool_urls': urls})
 
         if not urls:
             return []
 
-        existing = {t.name for t in self.tools}
-        lock = Lock()  # Thread-safe lock for shared data
-        added: list[str] = []
+        pool = _new_parse_pool()
+        self._parse_pool = pool
+        self._parse_pool_disabled = False
+        try:
+            return self._discover_from_urls(urls, links_ts)
+        finally:
+            self._parse_pool = None
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def _discover_from_urls(self, urls: list[str], links_ts: float) -> list[str]:
+        """Fetch, parse and record *urls*; the body of discover_from_kali_site."""
+        existing = self._tools_by_name
+        installed_set = self.refresh_installed_cache()
+        # Futures are drained on this thread, so results are collected without
+        # a lock. self.tools and both name indexes are only touched once
+        # draining stops -- even if it is interrupted -- so they never disagree.
+        discovered: dict[str, Tool] = {}
 
         def record_parsed(parsed: tuple[str, str | None, list[str]] | None) -> None:
             if not parsed:
                 return
             pkg, cat, subpkgs = parsed
-            with lock:
-                if pkg in existing:
-                    return
-                tool = Tool(
-                    name=pkg,
-                    commands=[],
-                    installed=self.check_installation(pkg),
-                    category=(cat or 'other'),
-                    size=0,
-                    subpackages=subpkgs or [],
-                )
-                self.tools.append(tool)
-                existing.add(pkg)
-                added.append(pkg)
-
-        if self.debug_scraper:
-            console.print("[cyan]Debug scraper mode: verbose output enabled with concurrency[/cyan]")
-            total = len(urls)
-            counter = 0
-            with ThreadPoolExecutor(max_workers=self.discovery_workers) as executor:
-                future_to_meta = {
-                    executor.submit(self._parse_tool_page_for_package, url): (idx, url)
-                    for idx, url in enumerate(urls, start=1)
-                }
-                for future in as_completed(future_to_meta):
-                    idx, url = future_to_meta[future]
+            if pkg in existing or pkg in discovered:
+                return
+            discovered[pkg] = Tool(
+                name=pkg,
+                commands=[],
+                installed=pkg in installed_set,
+                category=(cat or 'other'),
+                size=0,
+                subpackages=subpkgs or [],
+            )
+
+        try:
+            if self.debug_scraper:
+                console.print("[cyan]Debug scraper mode: verbose output enabled with concurrency[/cyan]")
+                total = len(urls)
+                url_index = {url: idx for idx, url in enumerate(urls, start=1)}
+                pool = _SlowStartPool(self.discovery_workers)
+                results = pool.run(self._parse_tool_page_for_package, urls)
+                for order, (url, future) in enumerate(results, start=1):
+                    idx = url_index[url]
                     try:
                         parsed = future.result()
                         record_parsed(parsed)
@@ -2073,47 +2574,48 @@ class KaliToolsManager:
                             status = "[yellow]  ⚠️  No package detected[/yellow]"
                     except Exception as exc:
                         status = f"[red]  ✗ Error parsing {url}: {exc}[/red]"
-                    finally:
-                        with lock:
-                            counter += 1
-                            order = counter
                     console.print(f"[dim]{idx}/{total} -> {url}")
                     console.print(status)
                     if order % 25 == 0:
                         console.print(f"[cyan]Processed {order}/{total} URLs...[/cyan]")
-            console.print(f"[cyan]Debug scrape complete: added {len(added)} tools[/cyan]")
-        else:
-            completed = 0
-            # Knight Rider style progress bar with bright, visible colors
-            with _cyber_progress(console=console, transient=False) as progress:
-                task = progress.add_task(
-                    "SCANNING KALI TOOLS",
-                    total=len(urls),
-                    completed=0
-                )
-
-                # Process URLs concurrently with ThreadPoolExecutor
-                with ThreadPoolExecutor(max_workers=self.discovery_workers) as executor:
-                    # Submit all fetch tasks
-                    future_to_url = {executor.submit(self._parse_tool_page_for_package, url): url for url in urls}
-
-                    # Process results as they complete
-                    for future in as_completed(future_to_url):
-                        url = future_to_url[future]
+                console.print(f"[cyan]Debug scrape complete: added {len(discovered)} tools[/cyan]")
+            else:
+                # Knight Rider style progress bar with bright, visible colors
+                with _cyber_progress(console=console, transient=False) as progress:
+                    task = progress.add_task(
+                        "SCANNING KALI TOOLS",
+                        total=len(urls),
+                        completed=0
+                    )
 
+                    # Process URLs concurrently; the window grows while pages come
+                    # back fine and shrinks when fetches fail.
+                    pool = _SlowStartPool(self.discovery_workers)
+                    results = pool.run(self._parse_tool_page_for_package, urls)
+                    for completed, (url, future) in enumerate(results, start=1):
                         try:
-                            parsed = future.result()
-                            record_parsed(parsed)
+                            record_parsed(future.result())
                         except Exception as exc:
                             logger.debug("Failed to parse %s: %s", url, exc)
-                        finally:
-                            with lock:
-                                completed += 1
-                                progress.update(task, completed=completed)
-
+                        progress.update(task, completed=completed)
+        finally:
+            if discovered:
+                new_tools = list(discovered.values())
+                self.tools.extend(new_tools)
+                for tool in new_tools:
+                    existing[tool.name] = tool
+                    self._tools_by_lower_name.setdefault(tool.name_lower, tool)
+                self.mark_tools_changed()
+        added = list(discovered)
         console.print(f"[green]✓ Discovery complete: Added {len(added)} new tools (Total: {len(self.tools)})[/green]")
+        parse_cache = self._page_parse_cache
+        self._save_kali_site_cache({
+            'timestamp': links_ts,
+            'tool_urls': urls,
+            'pages': {url: parse_cache[url] for url in urls if url in parse_cache},
+        })
         # Re-categorize known ones based on CATEGORIES mapping
-        self._categorize_tools()
+        self._prepare_tools(enrich=False)
         return added
 
     def get_cached_description(self, package_name: str) -> str | None:
@@ -2124,15 +2626,103 @@ class KaliToolsManager:
         """
         cached = self.description_cache.get(package_name)
         if cached is not None:
-            return cached
-        info = self.get_tool_info(package_name)
-        if not info:
+            return cached or None
+        base = self._stream_description(package_name)
+        if base:
+            self.description_cache[package_name] = base
+        return base
+
+    def _stream_description(self, package_name: str) -> str | None:
+        """Read ``apt-cache show`` only up to the end of the Description field.
+
+        The description sits near the top of the record, so the child is
+        stopped as soon as it has been captured instead of buffering the
+        whole output. A watchdog kills a child that stalls for more than
+        ``_APT_QUERY_TIMEOUT`` seconds; that, or a non-zero exit status,
+        yields ``None``.
+        """
+        try:
+            process = subprocess.Popen(
+                ['apt-cache', 'show', package_name],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=65536,
+                **_QUERY_RUN_KWARGS,
+            )
+        except Exception:
+            return None
+        expired = threading.Event()
+
+        def _expire() -> None:
+            expired.set()
+            process.kill()
+
+        watchdog = threading.Timer(_APT_QUERY_TIMEOUT, _expire)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            base = self._extract_description(process.stdout)
+        except Exception:
+            base = None
+        finally:
+            watchdog.cancel()
+            # Closing the pipe ends a child that is still writing (SIGPIPE).
+            process.stdout.close()
+            try:
+                returncode = process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                returncode = process.wait()
+        if expired.is_set():
+            logger.debug("apt-cache show %s timed out", package_name)
             return None
-        lines = info.splitlines()
+        # A signal exit is our own doing (closed pipe or kill); a positive
+        # code is apt-cache reporting failure, as checked by get_tool_info.
+        if returncode > 0:
+            return None
+        return base
+
+    def prefetch_descriptions(self, package_names: Iterable[str]) -> None:
+        """Fill ``description_cache`` for *package_names* with one apt-cache run.
+
+        ``apt-cache show --no-all-versions`` prints one blank-line separated
+        record per package, so a page of tools costs one fork instead of one
+        per row. Names the run printed no description for are cached as
+        misses, so get_cached_description does not fork for them either.
+        """
+        pending = [name for name in dict.fromkeys(package_names) if name not in self.description_cache]
+        if not pending or not _which('apt-cache'):
+            return
+        try:
+            result = subprocess.run(
+                ['apt-cache', 'show', '--no-all-versions', *pending],
+                capture_output=True,
+                text=True,
+                timeout=15,
+                **_QUERY_RUN_KWARGS,
+            )
+        except Exception:
+            return
+        # Unknown names make apt-cache exit non-zero but the known records
+        # are still printed, so parse whatever came back.
+        for record in result.stdout.split('\n\n'):
+            match = _PACKAGE_FIELD_RE.search(record)
+            if not match or match.group(1) in self.description_cache:
+                continue
+            base = self._extract_description(record.splitlines())
+            if base:
+                self.description_cache[match.group(1)] = base
+        for name in pending:
+            self.description_cache.setdefault(name, '')
+
+    @staticmethod
+    def _extract_description(lines: Iterable[str]) -> str | None:
         base: str | None = None
         continuation: list[str] = []
         capturing = False
         for line in lines:
+            line = line.rstrip('\n')
             if line.startswith('Description-en:') or line.startswith('Description:'):
                 # Prefer English description if both exist; first wins then we may override if en appears later
                 content = line.split(':', 1)[1].strip()
@@ -2148,21 +2738,18 @@ class KaliToolsManager:
                         continuation.append(line.strip())
                 else:
                     break
-        if base:
-            if continuation:
-                base = base + ' ' + ' '.join(continuation)
-            self.description_cache[package_name] = base
-            return base
-        return None
+        if base and continuation:
+            base = base + ' ' + ' '.join(continuation)
+        return base or None
 
     def show_tool_help(self, tool_name: str) -> bool:
         """Display tool help/usage"""
-        tool = next((t for t in self.tools if t['name'] == tool_name), None)
-        if not tool or not tool['commands']:
+        tool = self._tools_by_name.get(tool_name)
+        if not tool or not tool.commands:
             console.print(f"[yellow]No commands available for {tool_name}[/yellow]")
             return False
 
-        command = tool['commands'][0]
+        command = tool.commands[0]
         if not _LAUNCH_LEADING_TOKEN_RE.match(command):
             console.print(f"[red]Refusing unsafe command token: {command!r}[/red]")
             return False
@@ -2236,14 +2823,14 @@ class KaliToolsManager:
                     return False
                 logger.info("Launching command with metachars after user confirm: %r", command)
 
-            bash_path = shutil.which('bash')
+            bash_path = _which('bash')
             # Build the argv we want the terminal to execute. When the
             # command is clean we pass the parsed argv directly, so the
             # terminal spawns the tool without any shell involvement.
             if needs_shell and bash_path:
                 inner_argv = [bash_path, '-lc', f"{command}; exec bash"]
             elif needs_shell:
-                sh_path = shutil.which('sh') or '/bin/sh'
+                sh_path = _which('sh') or '/bin/sh'
                 inner_argv = [sh_path, '-c', command]
             else:
                 # Clean path: run the tool directly, keep shell open after.
@@ -2270,7 +2857,7 @@ class KaliToolsManager:
 
             for args in candidates:
                 term = args[0]
-                if not shutil.which(term):
+                if not _which(term):
                     continue
                 try:
                     subprocess.Popen(args)
@@ -2310,8 +2897,7 @@ class KaliToolsManager:
                 text=True
             )
 
-            with open(backup_file, 'w') as f:
-                f.write(result.stdout)
+            _atomic_write_text(backup_file, result.stdout)
 
             console.print(f"[green]✓ Backup created: {backup_file}[/green]")
             return True
@@ -2378,6 +2964,7 @@ class KaliToolsManager:
                 if mv_rc != 0:
                     console.print("[red]Failed to install sources.list.d entry (sudo mv failed).[/red]")
                     return False
+                self.finish_background_apt_update()
                 subprocess.run(['sudo', 'apt-get', 'update'])
             finally:
                 # mkstemp'd file will be gone after the mv on success; clean up on failure
@@ -2398,40 +2985,61 @@ class KaliToolsManager:
             console.print(f"[red]Error setting up local repo: {e}[/red]")
             return False
 
+    def get_tool(self, name: str) -> Tool | None:
+        """Return the tool named exactly *name*, or ``None``."""
+        return self._tools_by_name.get(name)
+
     def search_tools(self, query: str) -> list[dict]:
         """Search tools by name or command"""
         query = query.lower()
         return [
             tool for tool in self.tools
-            if query in tool['name'].lower() or
-            any(query in cmd.lower() for cmd in tool['commands'])
+            if query in tool.name_lower or
+            any(query in cmd.lower() for cmd in tool.commands)
         ]
 
+    def tool_table(self) -> ToolTable:
+        """Columnar view of ``self.tools``, rebuilt after ``mark_tools_changed``."""
+        if self._tool_table is None or self._tool_table[0] != self._tools_version:
+            self._tool_table = (self._tools_version, ToolTable(self.tools))
+        return self._tool_table[1]
+
     def filter_by_status(self, installed: bool) -> list[Tool]:
         """Filter tools by installation status"""
-        return [tool for tool in self.tools if tool.installed == installed]
+        return self.tool_table().filter(installed=installed)
 
     def filter_by_category(self, category: str) -> list[Tool]:
         """Filter tools by category"""
-        return [tool for tool in self.tools if tool.category == category]
+        return self.tool_table().filter(category=category)
 
     def get_statistics(self) -> dict:
-        """Get statistics about tools"""
-        total = len(self.tools)
-        installed = sum(1 for tool in self.tools if tool.installed)
-        total_size = sum(getattr(tool, 'size', 0) for tool in self.tools if tool.installed)
-
-        category_stats = {}
-        for category in set(t.category for t in self.tools):
-            cat_tools = [t for t in self.tools if t.category == category]
-            cat_installed = sum(1 for t in cat_tools if t.installed)
-            category_stats[category] = {
-                'total': len(cat_tools),
-                'installed': cat_installed,
-                'percentage': round((cat_installed / len(cat_tools) * 100), 1) if cat_tools else 0
+        """Get statistics about tools.
+
+        The result is cached until ``mark_tools_changed`` is called, so treat
+        the returned dict as read-only.
+        """
+        if self._stats_cache is not None and self._stats_cache[0] == self._tools_version:
+            return self._stats_cache[1]
+
+        # Aggregates come from the columnar table: the mask count, masked
+        # size sum and per-category tallies run in C without touching Tools.
+        table = self.tool_table()
+        total = len(table)
+        installed = table.installed_count()
+        total_size = table.total_installed_size()
+        cat_totals = table.category_counts()
+        cat_installed = table.category_counts(installed_only=True)
+
+        category_stats = {
+            category: {
+                'total': count,
+                'installed': cat_installed[category],
+                'percentage': round((cat_installed[category] / count * 100), 1),
             }
+            for category, count in cat_totals.items()
+        }
 
-        return {
+        stats = {
             'total': total,
             'installed': installed,
             'available': total - installed,
@@ -2440,4 +3048,6 @@ class KaliToolsManager:
             'total_size_mb': round(total_size / (1024 * 1024), 2),
             'categories': category_stats
         }
+        self._stats_cache = (self._tools_version, stats)
+        return stats
 
@@ -2,47 +2,144 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from itertools import compress
+from operator import itemgetter
 from typing import Any
 
+_FIELDS = (
+    'name', 'commands', 'installed', 'category', 'subcategory',
+    'description', 'size', 'subpackages', 'source', 'metadata',
+)
+_FIELD_KEYS = frozenset((*_FIELDS, 'name_lower'))
+# _FIELDS is also Tool.__init__'s positional order.
+_FIELD_GETTER = itemgetter(*_FIELDS)
+
+# Raw value -> normalized, interned string for the low-cardinality fields.
+# A catalog repeats the same handful of categories, subcategories and
+# sources, so every Tool shares one str object per distinct value and the
+# strip/lower work happens once per distinct input. Bounded so odd input
+# cannot grow them without limit.
+_CATEGORY_CACHE: dict[str, str] = {}
+_LABEL_CACHE: dict[str, str] = {}
+_CACHE_LIMIT = 4096
+
+
+def _canonical_category(value: Any) -> str:
+    try:
+        return _CATEGORY_CACHE[value]
+    except (KeyError, TypeError):
+        pass
+    category = sys.intern((value or 'other').strip().lower() or 'other')
+    if isinstance(value, str) and len(_CATEGORY_CACHE) < _CACHE_LIMIT:
+        _CATEGORY_CACHE[value] = category
+    return category
+
+
+def _canonical_label(value: Any) -> str:
+    try:
+        return _LABEL_CACHE[value]
+    except (KeyError, TypeError):
+        pass
+    label = sys.intern((value or '').strip())
+    if isinstance(value, str) and len(_LABEL_CACHE) < _CACHE_LIMIT:
+        _LABEL_CACHE[value] = label
+    return label
+
 
-@dataclass
 class Tool:
-    """Typed representation of a Kali tool entry."""
+    """Typed representation of a Kali tool entry.
+
+    Slotted: catalogs hold hundreds of these and the enrichment passes read
+    the same few attributes over and over, so there is no per-instance
+    ``__dict__`` to allocate or probe. The constructor normalizes every
+    field in one go instead of a dataclass ``__init__`` followed by a
+    ``__post_init__`` that rewrites each attribute a second time.
+    """
+
+    # ``name_lower`` is the lower-cased ``name`` for case-insensitive
+    # lookups; kept in sync by ``__init__`` and the manager's normalization
+    # pass, and left out of equality and ``repr``.
+    __slots__ = (*_FIELDS, 'name_lower')
 
     name: str
-    commands: list[str] = field(default_factory=list)
-    installed: bool = False
-    category: str = 'other'
-    subcategory: str = ''
-    description: str = ''
-    size: int = 0
-    subpackages: list[str] = field(default_factory=list)
-    source: str = ''
-    metadata: dict[str, Any] = field(default_factory=dict)
-
-    def __post_init__(self) -> None:
-        self.name = str(self.name or '').strip()
-        self.commands = self._normalize_list(self.commands)
-        if self.name and not any(cmd.lower() == self.name.lower() for cmd in self.commands):
-            self.commands.insert(0, self.name)
-        self.installed = bool(self.installed)
-        self.category = (self.category or 'other').strip().lower() or 'other'
-        self.subcategory = (self.subcategory or '').strip()
-        self.description = (self.description or '').strip()
-        self.size = int(self.size or 0)
-        self.subpackages = self._normalize_list(self.subpackages)
-        self.source = (self.source or '').strip()
-        self.metadata = dict(self.metadata or {})
+    commands: list[str]
+    installed: bool
+    category: str
+    subcategory: str
+    description: str
+    size: int
+    subpackages: list[str]
+    source: str
+    metadata: dict[str, Any]
+    name_lower: str
+
+    def __init__(
+        self,
+        name: str,
+        commands: list[str] | None = None,
+        installed: bool = False,
+        category: str = 'other',
+        subcategory: str = '',
+        description: str = '',
+        size: int = 0,
+        subpackages: list[str] | None = None,
+        source: str = '',
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        name = str(name or '').strip()
+        name_lower = name.lower()
+        commands = self._normalize_list(commands, prepend=name)
+        self.name = name
+        self.name_lower = name_lower
+        self.commands = commands
+        self.installed = bool(installed)
+        self.category = _canonical_category(category)
+        self.subcategory = _canonical_label(subcategory)
+        self.description = (description or '').strip()
+        self.size = int(size or 0)
+        self.subpackages = self._normalize_list(subpackages)
+        self.source = _canonical_label(source)
+        # A plain dict is adopted rather than copied; JSON loaders already
+        # share key strings, so nothing is gained by rebuilding it.
+        self.metadata = metadata if type(metadata) is dict else dict(metadata or {})
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{key}={getattr(self, key)!r}' for key in _FIELDS)
+        return f'{type(self).__name__}({fields})'
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in _FIELDS)
+
+    def __hash__(self) -> int:
+        # Names are unique within a catalog and equal tools have equal
+        # names, so tools can go in sets / dict keys directly. The name
+        # must not change while a tool is in one; other fields may.
+        return hash(self.name)
 
     @staticmethod
-    def _normalize_list(values: Any) -> list[str]:
+    def _normalize_list(values: Any, prepend: str = '') -> list[str]:
+        """Strip and case-insensitively dedupe *values*.
+
+        A non-empty *prepend* is seeded as the first entry, so a later value
+        equal to it (in any case) is dropped rather than searched for and
+        inserted at the front afterwards.
+        """
+        normalized: list[str] = [prepend] if prepend else []
+        # About half the catalog's lists (mostly subpackages) are empty.
+        if not values:
+            return normalized
         if isinstance(values, str):
             values = [values]
-        normalized: list[str] = []
-        seen: set[str] = set()
-        for value in values or []:
-            text = str(value or '').strip()
+        seen: set[str] = {prepend.lower()} if prepend else set()
+        for value in values:
+            # JSON input is all str; skip the str() round-trip for it.
+            text = value.strip() if type(value) is str else str(value or '').strip()
             if not text:
                 continue
             key = text.lower()
@@ -52,40 +149,146 @@ class Tool:
             normalized.append(text)
         return normalized
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, copy: bool = False) -> dict[str, Any]:
+        """Plain-dict view of the tool, e.g. for JSON output.
+
+        The ``commands``, ``subpackages`` and ``metadata`` containers are
+        shared with the tool unless *copy* is true; pass it when the result
+        will be mutated.
+        """
+        commands, subpackages, metadata = self.commands, self.subpackages, self.metadata
+        if copy:
+            commands, subpackages, metadata = list(commands), list(subpackages), dict(metadata)
         return {
             'name': self.name,
-            'commands': list(self.commands),
+            'commands': commands,
             'installed': self.installed,
             'category': self.category,
             'subcategory': self.subcategory,
             'description': self.description,
             'size': self.size,
-            'subpackages': list(self.subpackages),
+            'subpackages': subpackages,
             'source': self.source,
-            'metadata': dict(self.metadata),
+            'metadata': metadata,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Tool:
+        # Entries written by to_dict() carry every field, so one C-level
+        # itemgetter call fetches them all in constructor order. Partial
+        # dicts fall back to per-key lookups with the defaults.
+        try:
+            return cls(*_FIELD_GETTER(data))
+        except KeyError:
+            pass
+        get = data.get
         return cls(
-            name=data.get('name', ''),
-            commands=data.get('commands') or [],
-            installed=data.get('installed', False),
-            category=data.get('category', 'other'),
-            subcategory=data.get('subcategory', ''),
-            description=data.get('description', ''),
-            size=data.get('size', 0),
-            subpackages=data.get('subpackages') or [],
-            source=data.get('source', ''),
-            metadata=data.get('metadata') or {},
+            get('name', ''),
+            get('commands'),
+            get('installed', False),
+            get('category', 'other'),
+            get('subcategory', ''),
+            get('description', ''),
+            get('size', 0),
+            get('subpackages'),
+            get('source', ''),
+            get('metadata'),
         )
 
+    # Mapping-style access for code that still treats tools as dicts. Keys
+    # are checked against _FIELD_KEYS so unknown names behave like a dict
+    # (KeyError / default) instead of reaching methods or raising
+    # AttributeError. Hot loops should read attributes directly.
     def get(self, key: str, default: Any = None) -> Any:
-        return getattr(self, key, default)
+        return getattr(self, key) if key in _FIELD_KEYS else default
 
     def __getitem__(self, key: str):
-        return getattr(self, key)
+        if key in _FIELD_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
 
     def __setitem__(self, key: str, value: Any):
+        # name_lower is derived from name: readable, but only ever refreshed
+        # here so the two cannot drift apart.
+        if key not in _FIELDS:
+            raise KeyError(key)
         setattr(self, key, value)
+        if key == 'name':
+            self.name_lower = str(value).lower()
+
+
+class ToolTable:
+    """Column-oriented snapshot of a tool list for bulk filtering.
+
+    Keeps the fields the list filters touch in parallel columns:
+    ``installed`` as a byte mask, ``sizes`` as an ``int64`` array and
+    ``categories`` as small integer codes into an interned category list,
+    with each category's row numbers precomputed. Filters walk these
+    compact columns (``itertools.compress`` over the mask runs in C)
+    instead of loading every :class:`Tool`. Rows map back to the original
+    objects through :meth:`row`.
+
+    A snapshot: rebuild it after the underlying tools change.
+    """
+
+    __slots__ = ('_tools', 'names', 'installed', 'sizes', 'categories', '_category_codes', '_category_rows')
+
+    def __init__(self, tools: Iterable[Tool]) -> None:
+        self._tools = list(tools)
+        self.names = [tool.name for tool in self._tools]
+        self.installed = bytearray(tool.installed for tool in self._tools)
+        self.sizes = array('q', (tool.size for tool in self._tools))
+        self._category_codes: dict[str, int] = {}
+        self._category_rows: list[array] = []
+        codes = array('H')
+        for index, tool in enumerate(self._tools):
+            code = self._category_codes.get(tool.category)
+            if code is None:
+                code = self._category_codes[tool.category] = len(self._category_rows)
+                self._category_rows.append(array('I'))
+            codes.append(code)
+            self._category_rows[code].append(index)
+        self.categories = codes
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def row(self, index: int) -> Tool:
+        return self._tools[index]
+
+    def installed_count(self) -> int:
+        return self.installed.count(1)
+
+    def total_installed_size(self) -> int:
+        """Sum of ``size`` over installed rows, without touching any Tool."""
+        return sum(compress(self.sizes, self.installed))
+
+    def category_counts(self, *, installed_only: bool = False) -> dict[str, int]:
+        """Rows per category, in first-seen order; installed rows only if asked."""
+        names = list(self._category_codes)
+        if not installed_only:
+            return {name: len(rows) for name, rows in zip(names, self._category_rows, strict=True)}
+        counts = Counter(compress(self.categories, self.installed))
+        return {name: counts[code] for code, name in enumerate(names)}
+
+    def filter(self, *, category: str | None = None, installed: bool | None = None) -> list[Tool]:
+        """Return the tools matching every given criterion, in list order."""
+        tools = self._tools
+        if category is not None:
+            code = self._category_codes.get(category)
+            if code is None:
+                return []
+            rows = self._category_rows[code]
+            mask = self.installed
+            if installed is None:
+                return [tools[i] for i in rows]
+            return [tools[i] for i in rows if bool(mask[i]) is installed]
+        if installed is None:
+            return list(tools)
+        if installed:
+            return list(compress(tools, self.installed))
+        return list(compress(tools, self.installed.translate(_INVERT_MASK)))
+
+
+# Flips a 0/1 byte mask in one C-level bytes.translate call.
+_INVERT_MASK = bytes([1, 0]) + bytes(254)
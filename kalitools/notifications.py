@@ -2,44 +2,124 @@
 
 from __future__ import annotations
 
+import atexit
+import queue
+import threading
+import time
+from functools import cache
+from importlib.util import find_spec
+from typing import Any
+
 from . import logger
 
-try:
-    import notify2  # type: ignore
-    NOTIFICATIONS_AVAILABLE = True
-    _NOTIFY_INITIALIZED = False
-except ImportError:  # pragma: no cover - optional dependency
-    notify2 = None  # type: ignore
-    NOTIFICATIONS_AVAILABLE = False
-    _NOTIFY_INITIALIZED = False
+# notify2 pulls in dbus, so it is only imported when a notification is
+# actually about to be sent.
+NOTIFICATIONS_AVAILABLE = find_spec("notify2") is not None
 
+# Notifications are shown by a daemon worker so each D-Bus round-trip is
+# off the caller's thread; see send_notification.
+_QUEUE: queue.Queue[tuple[str, str]] = queue.Queue()
+_WORKER: threading.Thread | None = None
+_WORKER_LOCK = threading.Lock()
+# How long interpreter exit waits for queued notifications to be shown.
+_EXIT_FLUSH_TIMEOUT = 1.0
 
-def init_notifications_app() -> None:
-    """Initialise the desktop notification backend if available."""
-    global _NOTIFY_INITIALIZED
-    if not NOTIFICATIONS_AVAILABLE or _NOTIFY_INITIALIZED:
-        return
+
+@cache
+def _notify_backend() -> Any | None:
+    """Import and initialise notify2 once; ``None`` if unavailable or broken.
+
+    The cached result replaces the old module-level "initialised" flag, so
+    callers share a single initialisation and a failed one is not retried
+    (and re-logged) on every notification.
+    """
+    if not NOTIFICATIONS_AVAILABLE:
+        return None
     try:  # pragma: no cover - depends on desktop stack
+        import notify2  # type: ignore
+
         notify2.init("Kali Tools Manager")
-        _NOTIFY_INITIALIZED = True
-        logger.debug("notify2 initialised successfully")
     except Exception as exc:
         logger.warning("Could not initialise notify2: %s", exc)
-        _NOTIFY_INITIALIZED = False
+        return None
+    logger.debug("notify2 initialised successfully")  # pragma: no cover
+    return notify2  # pragma: no cover
+
+
+def init_notifications_app() -> None:
+    """Initialise the desktop notification backend if available."""
+    _notify_backend()
 
 
 def notifications_ready() -> bool:
     """Return True if desktop notifications can be sent."""
-    init_notifications_app()
-    return NOTIFICATIONS_AVAILABLE and _NOTIFY_INITIALIZED
+    return _notify_backend() is not None
 
 
-def send_notification(title: str, message: str) -> None:
-    """Best-effort desktop notification."""
-    if not notifications_ready():
-        return
+def _coalesce(batch: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Merge runs of same-title notifications into one summary each."""
+    merged: list[tuple[str, str, int]] = []
+    for title, message in batch:
+        if merged and merged[-1][0] == title:
+            _, first, count = merged[-1]
+            merged[-1] = (title, first, count + 1)
+        else:
+            merged.append((title, message, 1))
+    return [
+        (title, message if count == 1 else f"{message} (+{count - 1} more)")
+        for title, message, count in merged
+    ]
+
+
+def _show(backend: Any, title: str, message: str) -> None:
     try:  # pragma: no cover - UI nicety
-        notify = notify2.Notification(title, message)
-        notify.show()
+        backend.Notification(title, message).show()
     except Exception as exc:
         logger.debug("notify2 failed to show notification: %s", exc)
+
+
+def _worker() -> None:
+    while True:
+        batch = [_QUEUE.get()]
+        # Whatever else queued up meanwhile goes out as one burst.
+        while True:
+            try:
+                batch.append(_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        backend = _notify_backend()
+        if backend is not None:
+            for title, message in _coalesce(batch):
+                _show(backend, title, message)
+        for _ in batch:
+            _QUEUE.task_done()
+
+
+def _ensure_worker() -> None:
+    global _WORKER
+    if _WORKER is not None:
+        return
+    with _WORKER_LOCK:
+        if _WORKER is None:
+            _WORKER = threading.Thread(target=_worker, name="kalitools-notify", daemon=True)
+            _WORKER.start()
+            atexit.register(_flush, _EXIT_FLUSH_TIMEOUT)
+
+
+def _flush(timeout: float) -> None:
+    """Wait up to *timeout* seconds for queued notifications to be shown."""
+    deadline = time.monotonic() + timeout
+    while _QUEUE.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+
+def send_notification(title: str, message: str) -> None:
+    """Best-effort desktop notification, shown asynchronously.
+
+    Only enqueues; a daemon worker performs the D-Bus call and folds
+    bursts of same-title notifications into a single one.
+    """
+    if not NOTIFICATIONS_AVAILABLE:
+        return
+    _ensure_worker()
+    _QUEUE.put((title, message))
@@ -50,7 +50,7 @@ def user_profiles_dir() -> Path:
 
 def _load_profile_file(path: Path, source: str) -> Profile | None:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(path.read_bytes())
     except (OSError, json.JSONDecodeError) as exc:
         logger.warning("profile %s unreadable: %s", path, exc)
         return None
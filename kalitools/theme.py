@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from rich.console import Console
 from rich.theme import Theme
 
 THEMES: dict[str, Theme] = {
@@ -101,3 +102,18 @@ def strip_emojis(text: str) -> str:
         if glyph in out:
             out = out.replace(glyph, repl)
     return out
+
+
+class EmojiAwareConsole(Console):
+    """Rich ``Console`` subclass that strips emoji glyphs when requested."""
+
+    def __init__(self, *args, no_emoji: bool = False, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._no_emoji = no_emoji
+
+    def print(self, *objects, **kwargs):  # type: ignore[override]
+        if self._no_emoji and objects:
+            objects = tuple(
+                strip_emojis(o) if isinstance(o, str) else o for o in objects
+            )
+        return super().print(*objects, **kwargs)
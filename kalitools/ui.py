@@ -9,10 +9,12 @@ import sys
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
 from rich import box
+from rich.console import ConsoleDimensions, Group
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
@@ -48,6 +50,13 @@ except ImportError:
     tty = None  # type: ignore
     TERMIOS_AVAILABLE = False
 
+# Erase display + cursor home, as emitted by Console.clear().
+_CLEAR_HOME = "\x1b[2J\x1b[H"
+
+# Interactive-browser keys whose handlers only change state and print
+# nothing, so the next frame can be patched over the one on screen.
+_FRAME_PATCH_KEYS = frozenset({'UP', 'K', 'DOWN', 'J', 'N', 'RIGHT', 'P', 'LEFT', 'B', 'O', 'REDRAW'})
+
 
 class ToolsUI:
     """Enhanced Terminal UI for Kali Tools Manager"""
@@ -76,6 +85,10 @@ class ToolsUI:
         self._num_buf = ''
         self._size_executor = ThreadPoolExecutor(max_workers=4)
         self._size_futures: dict[str, Future[int]] = {}
+        # Rows of the interactive frame currently on screen; None forces a
+        # full repaint (see _render_frame).
+        self._last_lines: list[str] | None = None
+        self._last_size: ConsoleDimensions | None = None
 
     def flush_input_buffer(self):
         """Clear any pending keyboard input to avoid phantom key events."""
@@ -101,8 +114,7 @@ class ToolsUI:
         }
         if settings_file.exists():
             try:
-                with open(settings_file) as f:
-                    return {**default_settings, **json.load(f)}
+                return {**default_settings, **json.loads(settings_file.read_bytes())}
             except Exception:
                 return default_settings
         return default_settings
@@ -151,18 +163,16 @@ class ToolsUI:
 
         if self.search_query:
             query = self.search_query.lower()
-            tools = [tool for tool in tools if query in tool['name'].lower() or
-                     any(query in cmd.lower() for cmd in tool['commands'])]
-        if self.sort_mode == 'name':
-            tools.sort(key=lambda t: t['name'])
-        elif self.sort_mode == 'installed':
-            tools.sort(key=lambda t: (not t['installed'], t['name']))
+            tools = [tool for tool in tools if query in tool.name_lower or
+                     any(query in cmd.lower() for cmd in tool.commands)]
+        if self.sort_mode == 'installed':
+            tools.sort(key=lambda t: (not t.installed, t.name))
         elif self.sort_mode == 'size':
-            tools.sort(key=lambda t: getattr(t, 'size', 0), reverse=True)
+            tools.sort(key=attrgetter('size'), reverse=True)
         elif self.sort_mode == 'category':
-            tools.sort(key=lambda t: (getattr(t, 'category', ''), t['name']))
+            tools.sort(key=attrgetter('category', 'name'))
         else:
-            tools.sort(key=lambda t: t['name'])
+            tools.sort(key=attrgetter('name'))
         return tools
 
     def cycle_sort_mode(self):
@@ -296,9 +306,11 @@ class ToolsUI:
             'info': 'ℹ️'
         }
         symbol = symbols.get(style, '✅')
-        console.print(f"\n[{style}]┌{'─' * (len(message) + 4)}┐[/{style}]")
-        console.print(f"[{style}]│ {symbol} {message} │[/{style}]")
-        console.print(f"[{style}]└{'─' * (len(message) + 4)}┘[/{style}]\n")
+        rule = '─' * (len(message) + 4)
+        # One print: the box is parsed, rendered and flushed once.
+        console.print(
+            f"\n[{style}]┌{rule}┐\n│ {symbol} {message} │\n└{rule}┘[/{style}]\n"
+        )
 
     def show_utilities_menu(self):
         """Expose export/import/backup helpers in both UI modes."""
@@ -510,6 +522,7 @@ class ToolsUI:
                 tool.size = size
             except Exception:
                 pass
+        self.manager.mark_tools_changed()
         return size
 
 
@@ -566,9 +579,9 @@ class ToolsUI:
 
                 def _task_refresh():
                     # Let the manager refresh and then compute new tool names
-                    before = {t['name'] for t in self.manager.tools}
+                    before = {t.name for t in self.manager.tools}
                     added_count = self.manager.refresh_tools_from_sources()
-                    after = {t['name'] for t in self.manager.tools}
+                    after = {t.name for t in self.manager.tools}
                     new_names = sorted(after - before)
                     return added_count, new_names
 
@@ -583,6 +596,7 @@ class ToolsUI:
                     console.print("\n[bold yellow]Options:[/bold yellow] 1) Install all new tools  2) Remove a tool from list  3) Continue")
                     choice = Prompt.ask("[cyan]Select option[/cyan]", choices=["1","2","3"], default="3")
                     if choice == "1":
+                        self.manager.prewarm_dependencies(new_names)
                         for name in new_names:
                             self.manager.install_tool(name)
                         self.status_message = "[green]Installation requested for all new tools[/green]"
@@ -601,8 +615,7 @@ class ToolsUI:
 
     def show_statistics_bar(self):
         """Show compact statistics dashboard at top"""
-        console.print(self.build_statistics_bar_text())
-        console.print()
+        console.print(self.build_statistics_bar_text(), end="\n\n")
 
     def show_banner(self):
         """Display awesome cybersecurity-themed banner"""
@@ -671,6 +684,62 @@ class ToolsUI:
 
         return result_container["value"]
 
+    @staticmethod
+    def _frame_patch(old_lines: list[str], new_lines: list[str]) -> str:
+        """Escape sequences that turn *old_lines* on screen into *new_lines*.
+
+        Only rows that differ are rewritten (absolute cursor move, erase
+        line, new text); rows left over from a taller previous frame are
+        erased, and the cursor is parked just below the new frame.
+        """
+        kept = len(old_lines)
+        parts = [
+            f"\x1b[{row};1H\x1b[2K{line}"
+            for row, line in enumerate(new_lines, 1)
+            if row > kept or old_lines[row - 1] != line
+        ]
+        parts.append(f"\x1b[{len(new_lines) + 1};1H")
+        if len(new_lines) < len(old_lines):
+            parts.append("\x1b[J")
+        return "".join(parts)
+
+    def _render_frame(self, items: list[Any]) -> None:
+        """Draw *items* as a single write, repainting only changed rows.
+
+        The frame is rendered into a capture buffer first, so Rich lays
+        out every renderable in one pass and the terminal receives the
+        whole frame (including the screen clear) in one write. When the
+        previous frame is still on screen (``self._last_lines``) at the
+        same terminal size, only the rows that changed are rewritten --
+        on a cursor move that is the old and the new highlighted row.
+        Anything else clears the screen and writes the whole frame.
+        """
+        with console.capture() as capture:
+            console.print(Group(*items))
+        lines = capture.get().rstrip("\n").split("\n")
+        size = console.size
+        # Absolute row moves are only valid while neither frame has scrolled
+        # the terminal, i.e. both fit below its height.
+        last = self._last_lines
+        if (
+            last is not None
+            and size == self._last_size
+            and len(last) < size.height
+            and len(lines) < size.height
+        ):
+            payload = self._frame_patch(last, lines)
+        else:
+            payload = "\n".join(lines) + "\n"
+            if console.is_terminal and not console.is_dumb_terminal:
+                # Same effect as console.clear(), but in the frame's write.
+                payload = _CLEAR_HOME + payload
+        # One write and one flush per frame, so a full repaint costs a
+        # single write(2) even on a line-buffered TTY.
+        console.file.write(payload)
+        console.file.flush()
+        self._last_lines = lines
+        self._last_size = size
+
     def list_tools_interactive(self):
         """Interactive tool browser with real-time keyboard navigation"""
         if not TERMIOS_AVAILABLE:
@@ -679,6 +748,7 @@ class ToolsUI:
             self.run_basic_mode()
             return
         console.clear()
+        self._last_lines = None
         self.flush_input_buffer()
 
         needs_render = True
@@ -724,10 +794,9 @@ class ToolsUI:
                     header_items.append(Text(""))
                     header_items.append(Text.from_markup("[dim]Press any key to continue...[/dim]"))
 
-                    console.clear()
-                    for item in header_items:
-                        console.print(item)
+                    self._render_frame(header_items)
                     input()
+                    self._last_lines = None
                     self.set_view('all')
                     needs_render = True
                     continue
@@ -805,9 +874,7 @@ class ToolsUI:
                 button_bar = self.build_button_bar()
                 body_items.append(button_bar)
 
-                console.clear()
-                for item in body_items:
-                    console.print(item)
+                self._render_frame(body_items)
                 needs_render = False
 
             # Pre-loop auto-jump check (in case buffer aged while rendering)
@@ -910,6 +977,9 @@ class ToolsUI:
             # Any non-digit key clears the buffer silently
             if self._num_buf and (not key or not key.isdigit()):
                 self._num_buf = ''
+            if key not in _FRAME_PATCH_KEYS:
+                # The handler draws its own screen, so repaint in full after it.
+                self._last_lines = None
 
             if key in ('UP', 'K'):
                 if self.cursor_index > 0:
@@ -1042,7 +1112,7 @@ class ToolsUI:
 
     def show_tool_details(self, tool_name: str, interactive: bool = True):
         """Show enhanced tool details with apt-cache package information."""
-        tool = next((t for t in self.manager.tools if t['name'] == tool_name), None)
+        tool = self.manager.get_tool(tool_name)
         if not tool:
             console.print(f"[red]Tool '{tool_name}' not found![/red]")
             return
@@ -1271,6 +1341,7 @@ class ToolsUI:
             return
         elif choice == 'A':
             # Install all uninstalled sub-packages
+            self.manager.prewarm_dependencies(subpkg for subpkg, installed in pkg_status if not installed)
             for subpkg, installed in pkg_status:
                 if not installed:
                     console.print(f"\n[yellow]Installing {subpkg}...[/yellow]")
@@ -1415,6 +1486,7 @@ class ToolsUI:
             console.print("\n" + "=" * 60)
             console.print(f"Tools {start + 1}-{end} of {len(tools)} | Page {page}/{total_pages}")
             console.print("=" * 60)
+            self.manager.prefetch_descriptions(tool['name'] for tool in subset)
             for idx, tool in enumerate(subset, start=start + 1):
                 status = "INST" if tool['installed'] else "avail"
                 category = tool.get('category', 'other')
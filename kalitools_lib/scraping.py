@@ -1,22 +1,42 @@
 import json
 import re
+from importlib.util import find_spec
 
 try:
     from bs4 import BeautifulSoup  # type: ignore
 except Exception:
     BeautifulSoup = None  # type: ignore
 
+# Prefer lxml's C tree builder when installed; html.parser otherwise.
+HTML_PARSER = 'lxml' if find_spec('lxml') is not None else 'html.parser'
 
-def parse_tool_page(html: str) -> tuple[str, str | None, list[str]] | None:
+_PKG_NAME_RE = re.compile(r'^[a-z0-9][a-z0-9+\-.]{2,}$')
+_PACKAGE_FIELD_RE = re.compile(r'Package\s*:\s*([a-z0-9][a-z0-9+\-.]+)', re.IGNORECASE)
+_TAG_SEP_RE = re.compile(r'[;,]')
+# Tag keyword -> coarse category; one alternation instead of a nested loop.
+_TAG_CATEGORIES = {
+    'web': 'web', 'crawler': 'web', 'http': 'web', 'recon': 'recon', 'enumeration': 'recon',
+    'wireless': 'wireless', 'wifi': 'wireless', 'forensics': 'forensics', 'memory': 'forensics',
+    'exploitation': 'exploitation', 'exploit': 'exploitation', 'password': 'password', 'cracking': 'password',
+    'bruteforce': 'password', 'sniffing': 'sniffing', 'capture': 'sniffing', 'reverse': 'reverse',
+    'phishing': 'social', 'social': 'social', 'database': 'database', 'sql': 'database'
+}
+_TAG_CATEGORY_RE = re.compile('|'.join(re.escape(key) for key in _TAG_CATEGORIES))
+
+
+def parse_tool_page(html: str, soup=None) -> tuple[str, str | None, list[str]] | None:
     """Parse a Kali tool page HTML, returning (package, category, tags).
 
     - Prefers structured <dl><dt>Package</dt><dd>name</dd>
     - Extracts tags from <dt>Tags</dt><dd>...</dd> or similar
     - Maps tags to a coarse category using a simple mapping
+
+    Pass an already-built ``soup`` of *html* to skip re-parsing it.
     """
-    if not BeautifulSoup:
-        return None
-    soup = BeautifulSoup(html, 'html.parser')
+    if soup is None:
+        if not BeautifulSoup:
+            return None
+        soup = BeautifulSoup(html, HTML_PARSER)
 
     # Package
     package_candidates: list[str] = []
@@ -27,7 +47,7 @@ def parse_tool_page(html: str) -> tuple[str, str | None, list[str]] | None:
                 dd = dt.find_next('dd')
                 if dd:
                     txt = dd.get_text(strip=True).lower()
-                    if re.match(r'^[a-z0-9][a-z0-9+\-.]{2,}$', txt):
+                    if _PKG_NAME_RE.match(txt):
                         package_candidates.append(txt)
     pkg = package_candidates[0] if package_candidates else None
 
@@ -44,7 +64,7 @@ def parse_tool_page(html: str) -> tuple[str, str | None, list[str]] | None:
                 data = json.loads(script.string or '{}')
                 if isinstance(data, dict):
                     candidate = data.get('name') or data.get('headline')
-                    if candidate and re.match(r'^[a-z0-9][a-z0-9+\-.]{2,}$', candidate.lower()):
+                    if candidate and _PKG_NAME_RE.match(candidate.lower()):
                         pkg = candidate.lower()
                         break
             except Exception:
@@ -52,8 +72,9 @@ def parse_tool_page(html: str) -> tuple[str, str | None, list[str]] | None:
 
     # Fallback 3: textual regex search
     if not pkg:
-        text = soup.get_text('\n', strip=True)
-        m = re.search(r'Package\s*:\s*([a-z0-9][a-z0-9+\-.]+)', text, re.IGNORECASE)
+        # The raw HTML usually carries "Package: name" verbatim; only walk
+        # the whole tree for its text when markup splits the label.
+        m = _PACKAGE_FIELD_RE.search(html) or _PACKAGE_FIELD_RE.search(soup.get_text('\n', strip=True))
         if m:
             pkg = m.group(1).lower()
 
@@ -73,7 +94,7 @@ def parse_tool_page(html: str) -> tuple[str, str | None, list[str]] | None:
                         tag_values.extend(links)
                     else:
                         raw = dd.get_text(' ', strip=True).lower()
-                        tag_values.extend([t.strip() for t in re.split(r'[;,]', raw) if t.strip()])
+                        tag_values.extend([t.strip() for t in _TAG_SEP_RE.split(raw) if t.strip()])
 
     # Fallback: look for a tag cloud div or list
     if not tag_values:
@@ -93,23 +114,12 @@ def parse_tool_page(html: str) -> tuple[str, str | None, list[str]] | None:
                         tag_values.extend(links)
                     else:
                         raw = cells[1].get_text(' ', strip=True).lower()
-                        tag_values.extend([t.strip() for t in re.split(r'[;,]', raw) if t.strip()])
-
-    mapping = {
-        'web': 'web', 'crawler': 'web', 'http': 'web', 'recon': 'recon', 'enumeration': 'recon',
-        'wireless': 'wireless', 'wifi': 'wireless', 'forensics': 'forensics', 'memory': 'forensics',
-        'exploitation': 'exploitation', 'exploit': 'exploitation', 'password': 'password', 'cracking': 'password',
-        'bruteforce': 'password', 'sniffing': 'sniffing', 'capture': 'sniffing', 'reverse': 'reverse',
-        'phishing': 'social', 'social': 'social', 'database': 'database', 'sql': 'database'
-    }
+                        tag_values.extend([t.strip() for t in _TAG_SEP_RE.split(raw) if t.strip()])
+
     category: str | None = None
-    for tag in tag_values:
-        for key, cat in mapping.items():
-            if key in tag:
-                category = cat
-                break
-        if category:
-            break
+    match = _TAG_CATEGORY_RE.search('\n'.join(tag_values))
+    if match:
+        category = _TAG_CATEGORIES[match.group()]
     if not category and tag_values:
         category = 'other'
 
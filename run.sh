@@ -17,7 +17,7 @@ source "$VENV/bin/activate"
 # Auto-install if not already installed
 if ! python -c "import kalitools" 2>/dev/null; then
     echo "[*] Installing dependencies..."
-    pip install -e ".[notifications,disk,tui,fuzzy]" -q
+    pip install -e ".[notifications,tui,fuzzy]" -q
 fi
 
 exec kalitools "$@"
@@ -0,0 +1,188 @@
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+from kalitools import manager as manager_mod
+from kalitools.manager import KaliToolsManager
+
+APT_OUTPUT = """nmap
+  Depends: libc6
+  Depends: python3:any
+ |Depends: liblua5.4-0
+  Recommends: ndiff
+sqlmap
+  Depends: python3
+"""
+
+
+def test_prewarm_splits_sections_with_one_call(monkeypatch):
+    calls = []
+
+    def fake_depends(packages, timeout=20):
+        calls.append(list(packages))
+        return APT_OUTPUT
+
+    monkeypatch.setattr(manager_mod, "_which", lambda cmd: "/usr/bin/" + cmd)
+    monkeypatch.setattr(KaliToolsManager, "_apt_cache_depends", staticmethod(fake_depends))
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr._dependency_cache = {}
+
+    mgr.prewarm_dependencies(["nmap", "sqlmap", "missing"])
+
+    assert calls == [["nmap", "sqlmap", "missing"]]
+    assert mgr.get_dependencies("nmap") == ["libc6", "python3"]
+    assert mgr.get_dependencies("sqlmap") == ["python3"]
+    # Unknown names are cached negatively, so they cost no further forks.
+    assert mgr.get_dependencies("missing") == []
+    assert calls == [["nmap", "sqlmap", "missing"]]
+
+
+def test_single_dependency_lookup_uses_short_timeout(monkeypatch):
+    timeouts = []
+
+    def fake_depends(packages, timeout=20):
+        timeouts.append(timeout)
+        return ""
+
+    monkeypatch.setattr(manager_mod, "_which", lambda cmd: "/usr/bin/" + cmd)
+    monkeypatch.setattr(KaliToolsManager, "_apt_cache_depends", staticmethod(fake_depends))
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr._dependency_cache = {}
+
+    assert mgr.get_dependencies("nmap") == []
+    assert mgr.get_dependencies("nmap") == []
+    assert timeouts == [manager_mod._APT_QUERY_TIMEOUT]
+
+
+SHOW_OUTPUT = """Package: nmap
+Version: 7.94
+Description: The Network Mapper
+ Nmap is a utility for network exploration.
+
+Package: sqlmap
+Description-en: automatic SQL injection tool
+ sqlmap goal is to detect and take advantage of SQL injection.
+"""
+
+
+def test_prefetch_descriptions_parses_each_record(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=100, stdout=SHOW_OUTPUT)
+
+    monkeypatch.setattr(manager_mod, "_which", lambda cmd: "/usr/bin/" + cmd)
+    monkeypatch.setattr(manager_mod.subprocess, "run", fake_run)
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr.description_cache = {}
+
+    mgr.prefetch_descriptions(["nmap", "sqlmap", "missing"])
+
+    assert calls == [["apt-cache", "show", "--no-all-versions", "nmap", "sqlmap", "missing"]]
+    assert mgr.get_cached_description("nmap") == "The Network Mapper Nmap is a utility for network exploration."
+    assert mgr.get_cached_description("sqlmap").startswith("automatic SQL injection tool sqlmap")
+
+    # The miss is cached: no per-row apt-cache fork, and no second batch.
+    monkeypatch.setattr(KaliToolsManager, "_stream_description", lambda self, name: calls.append(name))
+    assert mgr.get_cached_description("missing") is None
+    mgr.prefetch_descriptions(["missing"])
+    assert len(calls) == 1
+
+
+def test_check_updates_reuses_background_apt_update(monkeypatch):
+    class FakePopen:
+        def __init__(self, cmd, **kwargs):
+            self.cmd = cmd
+
+        def poll(self):
+            return 0
+
+        def wait(self, timeout=None):
+            return 0
+
+    started = []
+
+    def fake_popen(cmd, **kwargs):
+        started.append(cmd)
+        return FakePopen(cmd, **kwargs)
+
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        return SimpleNamespace(returncode=0, stdout=b"", stderr="")
+
+    monkeypatch.setattr(manager_mod, "_which", lambda cmd: "/usr/bin/" + cmd)
+    monkeypatch.setattr(manager_mod.os, "geteuid", lambda: 0)
+    monkeypatch.setattr(manager_mod.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(manager_mod.subprocess, "run", fake_run)
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr.local_repo = None
+    mgr._apt_update_proc = None
+    mgr._tools_by_name = {}
+
+    assert mgr.start_background_apt_update()
+    mgr.check_updates(progress_callback=lambda *args: None)
+
+    assert started == [["apt-get", "update"]]
+    assert not any("update" in cmd for cmd in commands)
+    assert mgr._apt_update_proc is None
+
+
+def _popen_running(script, monkeypatch):
+    real_popen = manager_mod.subprocess.Popen
+
+    def fake_popen(cmd, **kwargs):
+        return real_popen([sys.executable, "-c", script], **kwargs)
+
+    monkeypatch.setattr(manager_mod.subprocess, "Popen", fake_popen)
+
+
+def test_stream_description_kills_stalled_apt_cache(monkeypatch):
+    _popen_running("import time; time.sleep(30)", monkeypatch)
+    monkeypatch.setattr(manager_mod, "_APT_QUERY_TIMEOUT", 0.2)
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+
+    started = time.monotonic()
+    assert mgr._stream_description("nmap") is None
+    assert time.monotonic() - started < 5
+
+
+def test_stream_description_rejects_failed_apt_cache(monkeypatch):
+    _popen_running("import sys; print('Description: partial'); sys.exit(100)", monkeypatch)
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+
+    assert mgr._stream_description("nmap") is None
+
+
+def test_privileged_ops_wait_for_background_apt_update(monkeypatch):
+    real_popen = manager_mod.subprocess.Popen
+    registered = []
+    monkeypatch.setattr(manager_mod, "_which", lambda cmd: "/usr/bin/" + cmd)
+    monkeypatch.setattr(manager_mod.os, "geteuid", lambda: 0)
+    monkeypatch.setattr(
+        manager_mod.subprocess, "Popen",
+        lambda cmd, **kwargs: real_popen([sys.executable, "-c", "import time; time.sleep(0.2)"], **kwargs),
+    )
+    monkeypatch.setattr(manager_mod.atexit, "register", lambda fn, *args: registered.append((fn, args)))
+    monkeypatch.setattr(KaliToolsManager, "verify_sudo_before_operation", lambda self: True)
+    monkeypatch.setattr(manager_mod.subprocess, "run", lambda cmd, **kwargs: SimpleNamespace(returncode=0))
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr.local_repo = None
+    mgr._apt_update_proc = None
+
+    assert mgr.start_background_apt_update()
+    proc = mgr._apt_update_proc
+    mgr.hold_package("nmap")
+
+    assert proc.returncode == 0
+    assert mgr._apt_update_proc is None
+    assert registered == [(manager_mod._stop_process, (proc,))]
+
+
+def test_unconsumed_background_apt_update_is_stopped():
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    manager_mod._stop_process(proc)
+    assert proc.returncode is not None
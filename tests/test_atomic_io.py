@@ -21,3 +21,9 @@ def test_atomic_write_text(tmp_path):
     path = tmp_path / "sample.txt"
     _atomic_write_text(path, "hello\n")
     assert path.read_text() == "hello\n"
+
+
+def test_atomic_write_json_compact(tmp_path):
+    path = tmp_path / "cache.json"
+    _atomic_write_json(path, {"nmap": True, "sqlmap": False}, indent=None)
+    assert path.read_text() == '{"nmap":true,"sqlmap":false}'
@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from kalitools import config as config_mod
 from kalitools.model import Tool
 
@@ -36,3 +38,35 @@ def test_import_with_installer_callback(tmp_path):
     names = mgr.import_tools_list(str(path), installer=fake_installer, assume_yes=True)
     assert names == ["nmap", "unknown-pkg"]
     assert installed == ["nmap"]  # unknown filtered out
+
+
+def test_import_streams_large_files(tmp_path, monkeypatch):
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(config_mod, "STREAM_THRESHOLD_BYTES", 0)
+    src = {"tools": [{"name": "nmap", "commands": ["nmap"]}, "hydra", {"name": "nmap"}]}
+    path = tmp_path / "import.json"
+    path.write_text(json.dumps(src))
+
+    mgr = config_mod.ConfigManager([])
+    assert mgr.import_tools_list(str(path)) == ["nmap", "hydra"]
+
+
+def test_read_tool_names_closes_fd_when_fstat_fails(tmp_path, monkeypatch):
+    path = tmp_path / "import.json"
+    path.write_text(json.dumps({"tools": ["nmap"]}))
+    closed = []
+    real_close = config_mod.os.close
+
+    def failing_fstat(fd):
+        raise OSError("fstat failed")
+
+    def tracking_close(fd):
+        closed.append(fd)
+        real_close(fd)
+
+    monkeypatch.setattr(config_mod, "ijson", object())
+    monkeypatch.setattr(config_mod.os, "fstat", failing_fstat)
+    monkeypatch.setattr(config_mod.os, "close", tracking_close)
+
+    assert config_mod.ConfigManager([])._read_tool_names(str(path)) == []
+    assert len(closed) == 1
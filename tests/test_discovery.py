@@ -0,0 +1,132 @@
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from kalitools import manager as manager_mod
+from kalitools.manager import KaliToolsManager, _PageFetchError, _SlowStartPool
+from kalitools.model import Tool
+
+
+def _discovery_manager(parsed_by_url):
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    known = Tool("nmap")
+    mgr.tools = [known]
+    mgr._tools_by_name = {"nmap": known}
+    mgr._tools_by_lower_name = {"nmap": known}
+    mgr._tools_version = 0
+    mgr.debug_scraper = True
+    mgr.discovery_workers = 1
+    mgr.refresh_installed_cache = lambda: set()
+    mgr._parse_tool_page_for_package = parsed_by_url.get
+    return mgr
+
+
+class _InterruptingConsole:
+    """Console stand-in that raises on the second per-URL status line."""
+
+    def __init__(self):
+        self.lines = 0
+
+    def print(self, *args, **kwargs):
+        self.lines += 1
+        if self.lines > 3:
+            raise KeyboardInterrupt
+
+
+def test_interrupted_discovery_keeps_tools_and_indexes_in_step(monkeypatch):
+    monkeypatch.setattr(manager_mod, "console", _InterruptingConsole())
+    mgr = _discovery_manager({
+        "u1": ("sqlmap", "web", []),
+        "u2": ("nikto", "web", []),
+        "u3": ("amass", "recon", []),
+    })
+
+    with pytest.raises(KeyboardInterrupt):
+        mgr._discover_from_urls(["u1", "u2", "u3"], 0)
+
+    names = {tool.name for tool in mgr.tools}
+    assert names == set(mgr._tools_by_name) == set(mgr._tools_by_lower_name)
+    assert "sqlmap" in names
+
+
+class _StubPool:
+    def __init__(self, error=None):
+        self.error = error
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+        if self.error is not None:
+            raise self.error
+        future = Future()
+        future.set_result(("from-pool", None, []))
+        return future
+
+
+def _pool_manager(pool):
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr._parse_pool = pool
+    mgr._parse_pool_disabled = False
+    return mgr
+
+
+def test_parse_page_body_uses_the_pool(monkeypatch):
+    monkeypatch.setattr(manager_mod, "_parse_tool_page_html", lambda url, body: ("inline", None, []))
+    pool = _StubPool()
+    mgr = _pool_manager(pool)
+
+    assert mgr._parse_page_body("u1", b"<html>") == ("from-pool", None, [])
+    assert pool.submitted == [("u1", b"<html>")]
+
+
+def test_broken_parse_pool_falls_back_inline_and_stays_owned(monkeypatch):
+    monkeypatch.setattr(manager_mod, "_parse_tool_page_html", lambda url, body: ("inline", None, []))
+    pool = _StubPool(BrokenProcessPool("worker died"))
+    mgr = _pool_manager(pool)
+
+    assert mgr._parse_page_body("u1", b"<html>") == ("inline", None, [])
+    assert mgr._parse_page_body("u2", b"<html>") == ("inline", None, [])
+    # Later pages skip the broken pool, but discover_from_kali_site still
+    # holds it and can shut it down.
+    assert len(pool.submitted) == 1
+    assert mgr._parse_pool is pool
+    assert mgr._parse_pool_disabled
+
+
+def test_discovery_shuts_down_a_pool_that_broke_mid_run(monkeypatch):
+    monkeypatch.setattr(manager_mod, "_parse_tool_page_html", lambda url, body: ("inline", None, []))
+    monkeypatch.setattr(manager_mod, "is_offline_mode", lambda: True)
+    pool = _StubPool(BrokenProcessPool("worker died"))
+    shutdowns = []
+    pool.shutdown = lambda **kwargs: shutdowns.append(kwargs)
+    monkeypatch.setattr(manager_mod, "_new_parse_pool", lambda: pool)
+    mgr = _pool_manager(None)
+    mgr._load_kali_site_cache = lambda: {"timestamp": time.time(), "tool_urls": ["u1"]}
+    mgr._discover_from_urls = lambda urls, ts: [mgr._parse_page_body(urls[0], b"")[0]]
+
+    assert mgr.discover_from_kali_site() == ["inline"]
+    assert shutdowns == [{"cancel_futures": True}]
+    assert mgr._parse_pool is None
+
+
+def test_only_fetch_failures_shrink_the_discovery_window(monkeypatch):
+    from kalitools import http_util
+
+    bodies = {"ok": b"<html><body>no package here</body></html>", "down": None}
+    monkeypatch.setattr(manager_mod, "_scraping_deps", lambda: (object(), None))
+    monkeypatch.setattr(http_util, "cached_get", lambda url, **kwargs: bodies[url])
+    monkeypatch.setattr(KaliToolsManager, "_parse_page_body", lambda self, url, body: None)
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr.page_cache_ttl = 0.0
+    mgr.discovery_delay = 0.0
+    mgr._page_parse_cache = {}
+
+    pool = _SlowStartPool(8)
+    list(pool.run(mgr._parse_tool_page_for_package, ["ok"] * 6))
+    assert pool.window == 8
+
+    results = list(pool.run(mgr._parse_tool_page_for_package, ["down"]))
+    assert isinstance(results[0][1].exception(), _PageFetchError)
+    assert pool.window == 4
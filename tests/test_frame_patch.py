@@ -0,0 +1,39 @@
+import io
+from types import SimpleNamespace
+
+from rich.console import Console
+from rich.text import Text
+
+from kalitools import ui as ui_mod
+from kalitools.ui import ToolsUI
+
+
+def test_frame_patch_rewrites_only_changed_rows():
+    old = ["banner", "  row one", "> row two", "footer"]
+    new = ["banner", "> row one", "  row two", "footer"]
+    patch = ToolsUI._frame_patch(old, new)
+    assert patch == (
+        "\x1b[2;1H\x1b[2K> row one"
+        "\x1b[3;1H\x1b[2K  row two"
+        "\x1b[5;1H"
+    )
+
+
+def test_frame_patch_handles_height_changes():
+    assert ToolsUI._frame_patch(["a"], ["a", "status"]) == "\x1b[2;1H\x1b[2Kstatus\x1b[3;1H"
+    assert ToolsUI._frame_patch(["a", "status"], ["a"]) == "\x1b[2;1H\x1b[J"
+
+
+def test_frame_after_an_overflowing_one_is_repainted_in_full(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr(ui_mod, "console", Console(file=out, width=40, height=5, force_terminal=True))
+    ui = SimpleNamespace(_last_lines=None, _last_size=None, _frame_patch=ToolsUI._frame_patch)
+
+    ToolsUI._render_frame(ui, [Text(f"row {i}") for i in range(8)])
+    out.seek(0)
+    out.truncate()
+    ToolsUI._render_frame(ui, [Text("row 0"), Text("changed")])
+
+    # The tall frame scrolled the screen, so no absolute row patch is sent.
+    assert out.getvalue().startswith(ui_mod._CLEAR_HOME)
+    assert "row 0" in out.getvalue()
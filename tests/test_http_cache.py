@@ -0,0 +1,56 @@
+import os
+from types import SimpleNamespace
+
+from kalitools import http_util
+
+
+def test_cached_get_serves_fresh_pages_from_disk(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_get(url, *, timeout, headers=None):
+        calls.append(url)
+        return SimpleNamespace(status_code=200, content=b"<html>nmap</html>", headers={})
+
+    monkeypatch.setattr(http_util, "page_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(http_util, "polite_get", fake_get)
+
+    url = "https://www.kali.org/tools/nmap/"
+    assert http_util.cached_get(url) == b"<html>nmap</html>"
+    assert http_util.cached_get(url) == b"<html>nmap</html>"
+    assert calls == [url]
+
+    # ttl=0 forces a re-fetch
+    http_util.cached_get(url, ttl=0)
+    assert calls == [url, url]
+
+
+def test_cached_get_revalidates_stale_pages_with_etag(tmp_path, monkeypatch):
+    sent = []
+    responses = [
+        SimpleNamespace(status_code=200, content=b"<html>v1</html>", headers={"ETag": '"abc"'}),
+        SimpleNamespace(status_code=304, content=b"", headers={}),
+    ]
+
+    def fake_get(url, *, timeout, headers=None):
+        sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(http_util, "page_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(http_util, "polite_get", fake_get)
+
+    url = "https://www.kali.org/tools/sqlmap/"
+    assert http_util.cached_get(url) == b"<html>v1</html>"
+    body_path = http_util._page_cache_path(url)
+    os.utime(body_path, (0, 0))  # make the cached copy stale
+
+    assert http_util.cached_get(url) == b"<html>v1</html>"
+    assert sent == [None, {"If-None-Match": '"abc"'}]
+    assert body_path.stat().st_mtime > 0
+
+
+def test_default_workers_env_override(monkeypatch):
+    monkeypatch.setenv("KALITOOLS_MAX_WORKERS", "3")
+    assert http_util.default_workers() == 3
+
+    monkeypatch.setenv("KALITOOLS_MAX_WORKERS", "lots")
+    assert 1 <= http_util.default_workers() <= http_util.POOL_MAXSIZE
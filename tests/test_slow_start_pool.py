@@ -0,0 +1,11 @@
+from kalitools.manager import _SlowStartPool
+
+
+def test_window_grows_on_success_and_halves_on_failure():
+    pool = _SlowStartPool(8)
+    results = {item: future.result() for item, future in pool.run(lambda x: x, range(20))}
+    assert sorted(results) == list(range(20))
+    assert pool.window == 8
+
+    list(pool.run(lambda x: None, range(3), is_failure=lambda r: r is None))
+    assert pool.window == 2
@@ -0,0 +1,12 @@
+from kalitools import manager as manager_mod
+from kalitools.manager import KaliToolsManager
+
+
+def test_sudo_never_verified_is_not_recent_right_after_boot(monkeypatch):
+    monkeypatch.setattr(manager_mod.time, "monotonic", lambda: 5.0)
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr._sudo_verified_at = None
+    assert not mgr._sudo_recently_verified()
+
+    mgr._sudo_verified_at = 1.0
+    assert mgr._sudo_recently_verified()
@@ -0,0 +1,98 @@
+import pytest
+
+from kalitools.model import Tool, ToolTable
+
+
+def test_tool_table_filters_match_list_scans():
+    tools = [
+        Tool("nmap", installed=True, category="recon", size=10),
+        Tool("sqlmap", category="web"),
+        Tool("nikto", installed=True, category="web", size=5),
+        Tool("amass", category="recon"),
+    ]
+    table = ToolTable(tools)
+
+    assert len(table) == 4
+    assert table.row(2) is tools[2]
+    assert table.filter(installed=True) == [tools[0], tools[2]]
+    assert table.filter(installed=False) == [tools[1], tools[3]]
+    assert table.filter(category="web") == [tools[1], tools[2]]
+    assert table.filter(category="web", installed=False) == [tools[1]]
+    assert table.filter(category="missing") == []
+    assert list(table.sizes) == [10, 0, 5, 0]
+
+
+def test_tool_table_aggregates():
+    table = ToolTable([
+        Tool("nmap", installed=True, category="recon", size=10),
+        Tool("sqlmap", category="web", size=7),
+        Tool("nikto", installed=True, category="web", size=5),
+    ])
+
+    assert table.installed_count() == 2
+    assert table.total_installed_size() == 15
+    assert table.category_counts() == {"recon": 1, "web": 2}
+    assert table.category_counts(installed_only=True) == {"recon": 1, "web": 1}
+
+
+def test_tools_hash_by_name():
+    nmap = Tool("nmap", category="recon")
+    same = Tool("nmap", category="recon")
+
+    assert {nmap, same} == {nmap}
+    nmap.installed = True
+    assert nmap in {nmap}
+    assert nmap != same
+
+
+def test_clearing_category_override_invalidates_table_and_stats(tmp_path, monkeypatch):
+    from kalitools.manager import KaliToolsManager
+
+    nmap = Tool("nmap", installed=True, category="recon")
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr.tools = [nmap, Tool("sqlmap", category="web")]
+    mgr._tools_by_lower_name = {t.name_lower: t for t in mgr.tools}
+    mgr._tools_version = 0
+    mgr._tool_table = None
+    mgr._stats_cache = None
+    mgr.category_overrides = {}
+    mgr.category_override_file = tmp_path / "overrides.json"
+    monkeypatch.setattr(
+        KaliToolsManager, "_infer_metadata_for_tool", lambda self, tool: setattr(tool, "category", "recon")
+    )
+
+    mgr.set_tool_category_override("nmap", "other", "misc")
+    assert mgr.filter_by_category("other") == [nmap]
+    assert mgr.get_statistics()["categories"]["other"]["total"] == 1
+
+    mgr.set_tool_category_override("nmap", None)
+    assert nmap.category == "recon"
+    assert mgr.filter_by_category("other") == []
+    assert mgr.filter_by_category("recon") == [nmap]
+    stats = mgr.get_statistics()["categories"]
+    assert "other" not in stats and stats["recon"]["total"] == 1
+
+
+def test_setitem_keeps_name_lower_in_step():
+    tool = Tool("Nmap")
+    tool["name"] = "SQLMap"
+    assert tool.name_lower == "sqlmap"
+    assert tool["name_lower"] == "sqlmap"
+    with pytest.raises(KeyError):
+        tool["name_lower"] = "other"
+    assert tool.name_lower == "sqlmap"
+
+
+def test_normalize_tool_entry_seeds_name_like_the_constructor():
+    from kalitools.manager import KaliToolsManager
+
+    mgr = KaliToolsManager.__new__(KaliToolsManager)
+    mgr._haystack_cache = {}
+    tool = Tool("nmap", category="recon")
+    tool.commands = ["nping", "NMAP", " nping "]
+    tool.subpackages = ["ncat", "NCAT", ""]
+
+    mgr._normalize_tool_entry(tool, {})
+
+    assert tool.commands == ["nmap", "nping"]
+    assert tool.subpackages == ["ncat"]